@@ -1,21 +1,73 @@
 import importlib
 import itertools
 import os
+import sys
+from functools import lru_cache
 from os import path
 from tempfile import gettempdir
 from typing import Optional
 
-import numpy as np
 from gate_api import CurrencyPair
 from pandas import DataFrame
 
 from framework.events.event_store import EventStore
 from framework.events.generic_event import GenericEvent
 from framework.quotes.price import Price
-from framework.tooling.tooling_utils import file_exists
+from framework.tooling.tooling_utils import file_exists, default_converter
 from framework.types.types_alias import GateioTimeFrame
 
 
+# Ensemble vide partagé, retourné pour les acteurs sans condition de passthrough
+empty_conditions: frozenset[str] = frozenset()
+
+
+@lru_cache(maxsize=None)
+def ensure_directory_exists(directory_path: str) -> str:
+    """
+    Crée un répertoire s'il n'existe pas encore, une seule fois par chemin et par processus.
+
+    Args:
+        directory_path (str): Le chemin du répertoire à créer.
+
+    Returns:
+        str: Le chemin du répertoire.
+    """
+    os.makedirs(directory_path, exist_ok=True)  # Un seul appel système, sans test d'existence préalable
+    return directory_path
+
+
+@lru_cache(maxsize=None)
+def import_class_from_path(class_path: str) -> type:
+    """
+    Résout une classe à partir de son chemin complet, en mémorisant le résultat pour les appels suivants.
+
+    Args:
+        class_path (str): Chemin complet de la classe (ex. 'package.module.Classe').
+
+    Returns:
+        type: La classe chargée.
+    """
+    module_path, _, class_name = class_path.rpartition('.')
+    module = sys.modules.get(module_path) or importlib.import_module(module_path)  # Importe le module si nécessaire
+    return getattr(module, class_name)
+
+
+@lru_cache(maxsize=128)
+def build_timeframe_column_names(timeframes: tuple[GateioTimeFrame, ...], selected_columns: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Construit (une seule fois par combinaison) les noms de colonnes `<timeframe>_<colonne>` du produit cartésien.
+
+    Args:
+        timeframes (tuple[GateioTimeFrame, ...]): Les intervalles de temps.
+        selected_columns (tuple[str, ...]): Les colonnes sélectionnées.
+
+    Returns:
+        tuple[str, ...]: Les noms de colonnes formatés (n-uplet immuable : le résultat mémorisé est partagé entre appelants).
+    """
+    columns_with_timeframes = itertools.product(timeframes, selected_columns)  # Produit cartésien des timeframes et colonnes
+    return tuple(f'{timeframe}_{column}' for timeframe, column in columns_with_timeframes)
+
+
 class BotCurrencyPair(CurrencyPair):
     """
     Classe représentant une paire de devises gérée par un bot de trading.
@@ -48,6 +100,21 @@ class BotCurrencyPair(CurrencyPair):
     | `default_converter`         | `json_converter`                     | Convertit en JSON les types non sérialisables   |
     """
 
+    # CurrencyPair (gate_api) conserve son __dict__ : les slots évitent d'y ajouter les attributs propres au bot,
+    # qui sont accédés par descripteur et décrivent l'ensemble des attributs manipulés par le bot
+    __slots__ = (
+        'passthrough_conditions',
+        'minimum_price',
+        'maximum_price',
+        'is_ready',
+        'event_store',
+        'data_directory',
+        'is_active',
+        'dataframe_backup_path',
+        'events_dump_path',
+        'machine_learning_models',
+    )
+
     def __init__(self,
                  pair_id=None,
                  base_currency=None,
@@ -101,7 +168,7 @@ class BotCurrencyPair(CurrencyPair):
             config_vars)
 
         # Initialisation des attributs spécifiques au bot de trading
-        self.passthrough_conditions: dict[str, list] = {}  # Dictionnaire pour les conditions de passthrough par acteur
+        self.passthrough_conditions: dict[str, frozenset[str]] = {}  # Dictionnaire pour les conditions de passthrough par acteur
         self.minimum_price: Price = Price.ZERO  # Prix minimal pour la paire
         self.maximum_price: Price = Price.ZERO  # Prix maximal pour la paire
         self.is_ready: bool = False  # Indicateur si le bot peut démarrer
@@ -125,12 +192,7 @@ class BotCurrencyPair(CurrencyPair):
         Returns:
             type: La classe chargée.
         """
-        class_data = class_path.split(".")
-        module_path = ".".join(class_data[:-1])
-        class_name = class_data[-1]
-
-        module = importlib.import_module(module_path)  # Importe dynamiquement le module
-        return getattr(module, class_name)  # Retourne la classe
+        return import_class_from_path(class_path)  # Résolution mémorisée entre toutes les paires
 
     def configure_machine_learning_models(self, models_config: dict):
         """
@@ -150,6 +212,36 @@ class BotCurrencyPair(CurrencyPair):
                 'event_class': event_class
             }
 
+    def save_machine_learning_model(self, model_key: str, model):
+        """
+        Sérialise un modèle de machine learning vers le chemin configuré par `configure_machine_learning_models`.
+        Le fichier est compressé (zlib, niveau 3), ce qui réduit fortement sa taille sur disque.
+
+        Args:
+            model_key (str): La clé du modèle dans `machine_learning_models`.
+            model: Le modèle à sauvegarder.
+        """
+        from joblib import dump  # Import différé : joblib n'est nécessaire qu'à la sauvegarde des modèles
+
+        dump(model, self.machine_learning_models[model_key]['model_path'], compress=3)
+
+    def load_machine_learning_model(self, model_key: str):
+        """
+        Charge un modèle de machine learning depuis le chemin configuré par `configure_machine_learning_models`.
+
+        Args:
+            model_key (str): La clé du modèle dans `machine_learning_models`.
+
+        Returns:
+            object: Le modèle chargé, ou None si le fichier n'existe pas.
+        """
+        from joblib import load  # Import différé : joblib n'est nécessaire qu'au chargement des modèles
+
+        model_path = self.machine_learning_models[model_key]['model_path']
+        if not path.exists(model_path):
+            return None
+        return load(model_path)
+
     def get_entity_directory(self, entity_type: str):
         """
         Crée et retourne le chemin d'un répertoire pour un type d'entité donné.
@@ -160,10 +252,7 @@ class BotCurrencyPair(CurrencyPair):
         Returns:
             str: Le chemin du répertoire pour le type d'entité.
         """
-        directory_path = path.join(self.data_directory, entity_type)
-        if not os.path.exists(directory_path):
-            os.makedirs(directory_path)  # Crée le répertoire s'il n'existe pas
-        return directory_path
+        return ensure_directory_exists(path.join(self.data_directory, entity_type))  # Crée le répertoire s'il n'existe pas
 
     def save_raw_dataframe(self, dataframe: DataFrame, timeframe: GateioTimeFrame):
         """
@@ -190,9 +279,8 @@ class BotCurrencyPair(CurrencyPair):
             if len(selected_columns) == 0:
                 dataframe.to_csv(self.dataframe_backup_path, index=True)  # Sauvegarde toutes les colonnes
             else:
-                columns_with_timeframes = itertools.product(timeframes, selected_columns)  # Produit cartésien des timeframes et colonnes
-                formatted_columns = [f'{timeframe}_{column}' for timeframe, column in columns_with_timeframes]
-                dataframe[formatted_columns].to_csv(self.dataframe_backup_path, index=True)  # Sauvegarde seulement les colonnes spécifiées
+                formatted_columns = build_timeframe_column_names(tuple(timeframes), tuple(selected_columns))
+                dataframe.loc[:, list(formatted_columns)].to_csv(self.dataframe_backup_path, index=True)  # Sauvegarde seulement les colonnes spécifiées
 
     def set_ready_state(self, result: bool) -> bool:
         """
@@ -264,12 +352,9 @@ class BotCurrencyPair(CurrencyPair):
             actor (str): L'acteur pour lequel les conditions s'appliquent.
             conditions (list[str]): Liste des conditions à ajouter.
         """
-        key = actor.lower()
-        values = [condition.lower() for condition in conditions]
-        if key in self.passthrough_conditions:
-            self.passthrough_conditions[key].extend(values)
-        else:
-            self.passthrough_conditions[key] = values
+        key = sys.intern(actor.lower())
+        values = frozenset(sys.intern(condition.lower()) for condition in conditions)  # Chaînes internées, partagées entre paires
+        self.passthrough_conditions[key] = self.passthrough_conditions.get(key, empty_conditions) | values
 
     def should_avoid_condition(self, actor: str, condition: str):
         """
@@ -282,8 +367,7 @@ class BotCurrencyPair(CurrencyPair):
         Returns:
             bool: True si la condition doit être évitée, sinon False.
         """
-        key = actor.lower()
-        return key in self.passthrough_conditions and condition.lower() in self.passthrough_conditions[key]
+        return condition.lower() in self.passthrough_conditions.get(actor.lower(), empty_conditions)  # Une seule recherche dans le dictionnaire
 
     def __hash__(self):
         """
@@ -333,11 +417,9 @@ class BotCurrencyPair(CurrencyPair):
             obj : L'objet à convertir.
 
         Returns:
-            bool : Représentation booléenne de l'objet si c'est un np.bool_.
+            bool | int | float : La valeur native correspondant au scalaire NumPy (np.bool_, np.int64, np.float32...).
 
         Raises:
             TypeError: Si l'objet n'est pas sérialisable.
         """
-        if isinstance(obj, np.bool_):
-            return bool(obj)
-        raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+        return default_converter(obj)
@@ -1,13 +1,19 @@
-from datetime import datetime, timedelta
+import warnings
+from datetime import datetime
 
 import numpy as np
-import pandas as pd
 from pandas import DataFrame, Series
 
 from framework.business.bot_currency_pair import BotCurrencyPair
 from framework.tooling.tooling_utils import timeframe_to_seconds
 from framework.types.types_alias import GateioTimeFrame
 
+# Générateur aléatoire partagé, utilisé pour produire le bruit de remplacement en un seul appel vectorisé
+random_generator = np.random.default_rng()
+
+# Précision des tampons d'indicateurs : float32 suffit aux bougies et divise par deux la bande passante mémoire
+indicator_dtype = np.float32
+
 
 def replace_nan_values(dataframe_column: Series):
     """
@@ -27,15 +33,50 @@ def replace_nan_values(dataframe_column: Series):
     Returns:
         Series: Une série avec les NaN remplacés par des valeurs générées aléatoirement.
     """
-    if not dataframe_column.dropna().empty:
-        first_valid_value = dataframe_column.dropna().iloc[0]
-        filled_column = dataframe_column.apply(lambda x: first_valid_value + np.random.normal(0, 1) if pd.isna(x) else x)
-        return filled_column
-    else:
+    nan_mask = dataframe_column.isna().to_numpy()
+    nan_count = int(nan_mask.sum())
+
+    # Rien à remplacer, ou aucune valeur de référence disponible
+    if nan_count == 0 or nan_count == len(nan_mask):
         return dataframe_column
 
+    first_valid_value = dataframe_column.iloc[int(np.argmin(nan_mask))]
+
+    # Conserver float32 si la colonne l'est déjà, sinon travailler en float64
+    values_dtype = np.float32 if dataframe_column.dtype == np.float32 else np.float64
+
+    # Un seul tirage vectorisé pour l'ensemble des NaN au lieu d'un appel par cellule
+    filled_values = dataframe_column.to_numpy(dtype=values_dtype, copy=True)
+    filled_values[nan_mask] = first_valid_value + random_generator.standard_normal(nan_count, dtype=values_dtype)
+    filled_column = Series(filled_values, index=dataframe_column.index, name=dataframe_column.name)
+    return filled_column
+
+
+def extract_price_values(dataframe: DataFrame, price_columns: list) -> np.ndarray:
+    """
+    Extrait les prix sous forme de tableau NumPy : la colonne elle-même s'il n'y en a qu'une, sinon la moyenne
+    ligne à ligne des colonnes (les NaN sont ignorés, comme avec `DataFrame.mean`).
+
+    Le résultat peut être calculé une seule fois puis transmis à `calculate_relative_strength_index` et à
+    `calculate_exponential_moving_average` via leur paramètre `price_values`.
+
+    Args:
+        dataframe (DataFrame): Le DataFrame contenant les colonnes de prix.
+        price_columns (list): Liste des colonnes de prix à agréger.
+
+    Returns:
+        np.ndarray: Les prix agrégés, au format `indicator_dtype`.
+    """
+    if len(price_columns) == 1:
+        return dataframe[price_columns[0]].to_numpy(dtype=indicator_dtype)
 
-def calculate_relative_strength_index(dataframe: DataFrame, price_columns: list, period_length=14):
+    # Les lignes entièrement NaN produisent NaN, sans avertissement "Mean of empty slice"
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        return np.nanmean(dataframe[price_columns].to_numpy(dtype=indicator_dtype), axis=1)
+
+
+def calculate_relative_strength_index(dataframe: DataFrame, price_columns: list, period_length=14, price_values: np.ndarray = None):
     """
     Calcule l'indicateur de force relative (RSI) pour un ensemble de colonnes dans un DataFrame.
 
@@ -54,27 +95,34 @@ def calculate_relative_strength_index(dataframe: DataFrame, price_columns: list,
         dataframe (DataFrame): Le DataFrame contenant les colonnes de prix.
         price_columns (list): Liste des colonnes de prix pour lesquelles calculer le RSI.
         period_length (int, optional): La période de calcul du RSI (par défaut 14).
+        price_values (np.ndarray, optional): Prix déjà extraits par `extract_price_values`, pour éviter de les recalculer.
 
     Returns:
         Series: Une série contenant les valeurs de RSI.
     """
-    if len(price_columns) == 1:
-        price_variation = dataframe[price_columns[0]].diff().fillna(0.0)
-    else:
-        price_variation = dataframe[price_columns].mean(axis=1).diff().fillna(0.0)
+    if price_values is None:
+        price_values = extract_price_values(dataframe, price_columns)
+
+    price_variation = np.diff(price_values, prepend=np.nan)
+    price_variation[np.isnan(price_variation)] = 0
+
+    # Gains et pertes lissés dans un seul appel EWM (une colonne chacun) plutôt que deux chaînes distinctes
+    gains_and_losses = np.column_stack((np.maximum(price_variation, 0), np.maximum(-price_variation, 0)))
+    smoothed = DataFrame(gains_and_losses).ewm(alpha=1 / period_length, adjust=False).mean().to_numpy(dtype=indicator_dtype)
+    average_gain, average_loss = smoothed[:, 0], smoothed[:, 1]
 
-    average_gain = (price_variation.where(price_variation > 0, 0)).ewm(alpha=1 / period_length, adjust=False).mean()
-    average_loss = (-price_variation.where(price_variation < 0, 0)).ewm(alpha=1 / period_length, adjust=False).mean()
-    relative_strength_ratio = average_gain / average_loss
-    relative_strength_ratio.replace(-np.inf, np.nan, inplace=True)
-    relative_strength_ratio.replace(+np.inf, np.nan, inplace=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio_values = average_gain / average_loss
 
-    relative_strength_ratio = replace_nan_values(relative_strength_ratio)
-    relative_strength_index = 100.0 - (100.0 / (1 + relative_strength_ratio))
-    return relative_strength_index
+    # Un seul passage sur le tampon pour neutraliser les valeurs infinies (±inf → NaN)
+    ratio_values[~np.isfinite(ratio_values)] = np.nan
 
+    relative_strength_ratio = replace_nan_values(Series(ratio_values, index=dataframe.index))
+    relative_strength_index = indicator_dtype(100) - (indicator_dtype(100) / (indicator_dtype(1) + relative_strength_ratio.to_numpy()))
+    return Series(relative_strength_index, index=dataframe.index, dtype=indicator_dtype)
 
-def calculate_exponential_moving_average(dataframe: DataFrame, price_columns: list, period_length: int = 10):
+
+def calculate_exponential_moving_average(dataframe: DataFrame, price_columns: list, period_length: int = 10, price_values: np.ndarray = None):
     """
     Calcule la moyenne mobile exponentielle (EMA) pour un ensemble de colonnes dans un DataFrame.
 
@@ -84,27 +132,27 @@ def calculate_exponential_moving_average(dataframe: DataFrame, price_columns: li
     | `calculate_ema`                         | `calculate_exponential_moving_average`     | Fonction pour calculer la moyenne mobile exponentielle (EMA)      |
     | `columns`                               | `price_columns`                            | Liste des colonnes de prix pour calculer l'EMA                    |
     | `length`                                | `period_length`                            | Période pour le calcul de l'EMA                                   |
-    | `new_dataframe`                         | `adjusted_dataframe`                       | DataFrame ajusté contenant les colonnes de prix pour le calcul    |
+    | `new_dataframe`                         | `price_series`                             | Série des prix ajustés utilisée pour le calcul                    |
     | `column_name_that_prevents_warning`     | `main_price_column`                        | Nom utilisé pour la colonne de prix dans le DataFrame             |
 
     Args:
         dataframe (DataFrame): Le DataFrame contenant les colonnes de prix.
         price_columns (list): Liste des colonnes pour lesquelles calculer l'EMA.
         period_length (int, optional): La période de calcul de l'EMA (par défaut 10).
+        price_values (np.ndarray, optional): Prix déjà extraits par `extract_price_values`, pour éviter de les recalculer.
 
     Returns:
         Series: Une série contenant les valeurs de l'EMA.
     """
-    adjusted_dataframe = DataFrame()
     main_price_column = 'close'
 
-    if len(price_columns) == 1:
-        adjusted_dataframe[main_price_column] = dataframe[price_columns[0]].fillna(0.0)
-    else:
-        adjusted_dataframe[main_price_column] = dataframe[price_columns].mean(axis=1).fillna(0.0)
+    if price_values is None:
+        price_values = extract_price_values(dataframe, price_columns)
 
-    return adjusted_dataframe.ewm(span=period_length, adjust=False).mean().fillna(0.0)
-    # return ta.ema(adjusted_dataframe, length=period_length).fillna(0.0)
+    # EWM calculé directement sur une série : pas de DataFrame intermédiaire, seul le résultat est encapsulé
+    price_series = Series(np.nan_to_num(price_values, nan=0.0), index=dataframe.index, name=main_price_column)
+    moving_average = price_series.ewm(span=period_length, adjust=False).mean().fillna(0.0).astype(indicator_dtype)
+    return moving_average.to_frame()
 
 
 def calculate_hourly_volume(currency_pair: BotCurrencyPair, dataframe: DataFrame, rsi_column: str, current_time: datetime, timeframe: GateioTimeFrame,
@@ -140,13 +188,12 @@ def calculate_hourly_volume(currency_pair: BotCurrencyPair, dataframe: DataFrame
     # Utilisation de la durée du timeframe pour garantir un calcul robuste
     total_seconds_in_timeframe = timeframe_to_seconds(timeframe)
 
-    # Calcul du temps écoulé dans la dernière bougie
-    elapsed_time_in_candle = (current_time - dataframe.index[-1]) % timedelta(seconds=total_seconds_in_timeframe)
-    elapsed_time_in_seconds = elapsed_time_in_candle.total_seconds()
+    # Calcul du temps écoulé dans la dernière bougie, en secondes flottantes (pas de modulo entre objets Timedelta)
+    elapsed_time_in_seconds = (current_time - dataframe.index[-1]).total_seconds() % total_seconds_in_timeframe
 
     # Obtenir les valeurs actuelles du RSI et du volume de trading
-    current_rsi_value = dataframe[rsi_column].iloc[-1]
-    current_trading_volume = dataframe['volume'].iloc[-1]
+    current_rsi_value = float(dataframe[rsi_column].iloc[-1])
+    current_trading_volume = float(dataframe['volume'].iloc[-1])
 
     # Gestion du cas où elapsed_time_in_seconds est égal à 0 (bougie complète)
     if elapsed_time_in_seconds == 0:
@@ -155,14 +202,15 @@ def calculate_hourly_volume(currency_pair: BotCurrencyPair, dataframe: DataFrame
         # Calcul du volume normalisé par seconde si la bougie n'est pas complète
         normalized_volume_per_second = total_seconds_in_timeframe * (current_trading_volume / elapsed_time_in_seconds)
 
-    # Filtrer les segments basés sur le RSI avec la tolérance définie
-    filtered_rsi_segment = dataframe[
-        (dataframe[rsi_column] >= current_rsi_value - tolerance_bandwidth) &
-        (dataframe[rsi_column] <= current_rsi_value + tolerance_bandwidth)
-    ]
+    # Filtrer les segments basés sur le RSI avec la tolérance définie, sans construire de DataFrame intermédiaire
+    rsi_values = dataframe[rsi_column].to_numpy(dtype=np.float64)
+    volume_values = dataframe['volume'].to_numpy(dtype=np.float64)
+    filtered_rsi_segment = (rsi_values >= current_rsi_value - tolerance_bandwidth) & (rsi_values <= current_rsi_value + tolerance_bandwidth)
 
     # Calcul du volume moyen des segments filtrés, retourner 0 si aucune valeur n'est trouvée (éviter NaN)
-    mean_filtered_volume = filtered_rsi_segment['volume'].mean() or 0
+    filtered_volumes = volume_values[filtered_rsi_segment]
+    filtered_volumes = filtered_volumes[~np.isnan(filtered_volumes)]
+    mean_filtered_volume = filtered_volumes.mean() if filtered_volumes.size else 0
 
     # Retourner le volume normalisé et le volume moyen filtré
     return normalized_volume_per_second, mean_filtered_volume
@@ -1,18 +1,37 @@
 import json
 import os
 import threading
-from typing import LiteralString
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, LiteralString, Optional
 from typing import Self
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from framework.business.bot_currency_pair import BotCurrencyPair
 from framework.business.gateio_proxy import GateioProxy
 from framework.logs.logs_utils import logger
 from framework.quotes.quotes_utils import gateio_currency_pair
+from framework.threads.file_reloader import FileReloader
 from framework.tooling.tooling_utils import resolve_path_json_pairs, verify_pair
 
+try:
+    from yaml import CSafeLoader as AssetsYamlLoader  # Analyseur C (libyaml)
+except ImportError:
+    from yaml import SafeLoader as AssetsYamlLoader
+
+    logger.warning('PyYAML is not built with libyaml: falling back to the pure Python YAML loader')
+
+# Session HTTP partagée : les connexions TCP/TLS vers gate.io sont réutilisées d'une page à l'autre
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3)))
+http_timeout = (3, 10)  # Délais de connexion et de lecture, en secondes
+
+# Nombre maximal de threads des exécuteurs locaux (lecture des fichiers JSON, récupération des pages)
+max_io_workers = 8
+
 
 class ListOfAssets:
     """
@@ -33,7 +52,6 @@ class ListOfAssets:
     | `self.__files_timestamp_modifications`| `self.file_modification_timestamps`            | Suivi des horodatages de modification des fichiers JSON.    |
     | `self.__retrieve_pairs_files`         | `self.retrieve_asset_files`                    | Méthode pour récupérer les fichiers contenant les paires.   |
     | `self.__update_tokens`                | `self.update_active_tokens`                    | Met à jour l'état des paires d'actifs (actives/inactives).  |
-    | `self.__update_search_structure`      | `self.refresh_currency_pairs_index`            | Actualise l'index de recherche des paires de devises.       |
     | `self.__files_containing_assets_lists`| `self.asset_file_configuration`                | Fichiers de configuration contenant des listes d'actifs.    |
     | `self.currency_pairs_index`           | `self.asset_search_index`                      | Index des paires de devises pour la recherche rapide.       |
     | `load_from_yaml_file`                 | `load_assets_from_yaml_configuration`          | Charge les actifs à partir du fichier de configuration YAML.|
@@ -45,13 +63,18 @@ class ListOfAssets:
         self.configuration_absolute_path = os.path.abspath(self.assets_configuration_yaml_path)
         self.trading_quote_currency = quote
         self.asset_limit = limit
-        self.loaded_assets = []
         self.threading_lock = threading.Lock()
         self.file_modification_timestamps = {}
         self.asset_file_configuration = {}
         self.asset_search_index: dict[str, BotCurrencyPair] = {}
+        self.yaml_configuration_cache: tuple = (None, None)  # (horodatage, configuration), remplacé d'un seul bloc
         self.load_assets_from_yaml_configuration()
 
+    @property
+    def loaded_assets(self) -> list[BotCurrencyPair]:
+        # Les actifs chargés sont dérivés de l'index, seule structure maintenue
+        return list(self.asset_search_index.values())
+
     @property
     def assets(self) -> list[BotCurrencyPair]:
         with self.threading_lock:
@@ -63,58 +86,193 @@ class ListOfAssets:
         return self
 
     def load_assets_from_yaml_configuration(self) -> Self:
+        # Les lectures (YAML, stat() et fichiers JSON) se font hors du verrou, qui ne protège que l'échange des résultats
+        previous_yaml_timestamp = self.yaml_configuration_cache[0]
+        asset_file_configuration, forbidden_assets = self.retrieve_asset_files()
+        # Configuration modifiée : tous les fichiers sont relus
+        known_timestamps = self.file_modification_timestamps if self.yaml_configuration_cache[0] == previous_yaml_timestamp else {}
+        effective_assets_lists = {key: value for key, value in asset_file_configuration.items() if value['enabled']}
+        # Un seul stat() par fichier, horodatage en nanosecondes (comparaison exacte)
+        modification_times = {file: os.stat(file).st_mtime_ns for file in effective_assets_lists}
+        files_to_reload = [file for file, getmtime in modification_times.items() if getmtime != known_timestamps.get(file)]
+        if not files_to_reload:
+            with self.threading_lock:
+                self.asset_file_configuration = asset_file_configuration
+            return self  # Rien n'a changé : les actifs chargés restent en l'état
+
+        loaded_trading_pairs = self.load_trading_pairs_from_files(files_to_reload, forbidden_assets)
+        candidates: dict[str, BotCurrencyPair] = {}
+        for file_containing_assets_lists, trading_pairs in zip(files_to_reload, loaded_trading_pairs):
+            # Compléter les candidats, dédoublonnés par identifiant, dans la limite globale d'actifs
+            for trading_pair in trading_pairs:
+                if len(candidates) >= self.asset_limit:
+                    break
+                candidates.setdefault(trading_pair.id, trading_pair)
+            # Application des conditions de passthrough, une fois par couple (paire, condition)
+            passthrough = effective_assets_lists[file_containing_assets_lists]['passthrough']
+            if passthrough is not None:
+                passthrough_items = list(passthrough.items())
+                for trading_pair in trading_pairs:
+                    # Une paire présente dans plusieurs fichiers reçoit les conditions de chacun sur l'objet conservé
+                    kept_trading_pair = candidates.get(trading_pair.id, trading_pair)
+                    for key, conditions in passthrough_items:
+                        kept_trading_pair.add_passthrough_condition(key, conditions)
+
+        file_modification_timestamps = dict(known_timestamps)
+        file_modification_timestamps.update((file, modification_times[file]) for file in files_to_reload)
         with self.threading_lock:
-            trading_pairs: set[BotCurrencyPair] = set()
-            candidates: list[BotCurrencyPair] = []
-            self.asset_file_configuration, forbidden_assets = self.retrieve_asset_files()
-            effective_assets_lists = {key: value for key, value in self.asset_file_configuration.items() if value['enabled']}
-            [self.file_modification_timestamps.setdefault(file, None) for file in effective_assets_lists]
-            for file_containing_assets_lists, configuration in effective_assets_lists.items():
-                getmtime = os.path.getmtime(file_containing_assets_lists)
-                passthrough = configuration['passthrough']
-                if getmtime != self.file_modification_timestamps[file_containing_assets_lists]:
-                    with open(file_containing_assets_lists, 'r') as fichier:
-                        for symbol in json.load(fichier):
-                            if symbol not in forbidden_assets:
-                                currency_pair = gateio_currency_pair(pair_symbol=symbol, keep_pair_quote=True, trading_quote=self.trading_quote_currency)
-                                trading_pairs.add(currency_pair)
-                        [trading_pair.add_passthrough_condition(key, conditions)
-                         for trading_pair in trading_pairs for key, conditions in (passthrough.items()
-                                                                                   if passthrough is not None else [])]
-                        candidates = candidates + list(trading_pairs)[:self.asset_limit]
-                        self.file_modification_timestamps[file_containing_assets_lists] = getmtime
-            self.update_active_tokens(candidates)
-            self.refresh_currency_pairs_index()
-            return self
+            self.asset_file_configuration = asset_file_configuration
+            self.file_modification_timestamps = file_modification_timestamps
+            self.update_active_tokens(list(candidates.values()))
+        return self
+
+    def watched_file_paths(self) -> list[str]:
+        """
+        Retourne les fichiers dont la modification doit déclencher un rechargement des actifs.
+
+        Returns:
+            list[str]: Le fichier YAML de configuration et les fichiers JSON activés.
+        """
+        return [self.assets_configuration_yaml_path] + [file for file, value in self.asset_file_configuration.items() if value['enabled']]
+
+    def watch_for_changes(self, poll_interval: float = 5.0) -> FileReloader:
+        """
+        Démarre un rechargement des actifs déclenché par la modification des fichiers de configuration.
+
+        Args:
+            poll_interval (float): Intervalle de scrutation des fichiers, en secondes.
+
+        Returns:
+            FileReloader: Le surveillant démarré, à arrêter avec `stop()`.
+        """
+        return FileReloader(self.watched_file_paths, self.load_assets_from_yaml_configuration, poll_interval).start()
+
+    def load_trading_pairs_from_file(self, file_path: str, forbidden_assets: frozenset[str]) -> set[BotCurrencyPair]:
+        """
+        Construit les paires de devises listées dans un fichier JSON, au fil de la lecture des symboles.
+
+        Args:
+            file_path (str): Le chemin du fichier JSON contenant la liste des symboles.
+            forbidden_assets (frozenset[str]): Les symboles à ignorer.
+
+        Returns:
+            set[BotCurrencyPair]: Les paires de devises propres à ce fichier.
+        """
+        trading_pairs: set[BotCurrencyPair] = set()
+        for symbol in iterate_json_array(file_path):
+            if symbol not in forbidden_assets:
+                currency_pair = gateio_currency_pair(pair_symbol=symbol, keep_pair_quote=True, trading_quote=self.trading_quote_currency)
+                if currency_pair is not None:  # Paires dont la base et la quote sont identiques
+                    trading_pairs.add(currency_pair)
+        return trading_pairs
+
+    def load_trading_pairs_from_files(self, file_paths: list[str], forbidden_assets: frozenset[str]) -> list[set[BotCurrencyPair]]:
+        """
+        Construit les paires de devises de plusieurs fichiers JSON, lus en parallèle lorsqu'ils sont plusieurs.
+
+        Un exécuteur local et éphémère est utilisé : le pool partagé peut être occupé par la tâche même qui recharge
+        les actifs, et l'attendre depuis l'une de ses tâches pourrait bloquer indéfiniment.
+
+        Args:
+            file_paths (list[str]): Les chemins des fichiers JSON.
+            forbidden_assets (frozenset[str]): Les symboles à ignorer.
+
+        Returns:
+            list[set[BotCurrencyPair]]: Les paires de devises de chaque fichier, dans l'ordre des chemins.
+        """
+        if len(file_paths) == 1:
+            return [self.load_trading_pairs_from_file(file_paths[0], forbidden_assets)]
+        with ThreadPoolExecutor(max_workers=min(len(file_paths), max_io_workers)) as executor:
+            return list(executor.map(lambda file: self.load_trading_pairs_from_file(file, forbidden_assets), file_paths))
 
     def retrieve_asset_files(self):
-        with open(self.assets_configuration_yaml_path, 'r') as f:
-            configuration = yaml.load(f, Loader=yaml.FullLoader)
-            asset_files = {resolve_path_json_pairs(script_path=self.configuration_absolute_path,
-                                                   file_name=key): value for key, value in configuration['files'].items()}
-            return asset_files, configuration['forbidden']
+        configuration = self.load_yaml_configuration_cached()
+        asset_files = {resolve_path_json_pairs(script_path=self.configuration_absolute_path,
+                                               file_name=key): value for key, value in configuration['files'].items()}
+        return asset_files, frozenset(configuration['forbidden'] or ())  # Recherche O(1) par symbole
+
+    def load_yaml_configuration_cached(self) -> dict:
+        """
+        Retourne la configuration YAML des actifs, en ne la ré-analysant que si le fichier a été modifié.
+
+        Returns:
+            dict: La configuration des actifs.
+        """
+        yaml_timestamp = os.stat(self.assets_configuration_yaml_path).st_mtime_ns
+        cached_timestamp, cached_configuration = self.yaml_configuration_cache
+        if yaml_timestamp == cached_timestamp:
+            return cached_configuration
+
+        with open(self.assets_configuration_yaml_path, 'rb') as f:
+            configuration = yaml.load(f, Loader=AssetsYamlLoader)
+
+        self.yaml_configuration_cache = (yaml_timestamp, configuration)  # Horodatage et configuration toujours cohérents
+        return configuration
 
     def update_active_tokens(self, new_pairs: list[BotCurrencyPair]):
         # Marquer tous les tokens comme inactifs initialement
+        for token in self.asset_search_index.values():
+            token.active = False
+        # Réactiver les tokens existants, ajouter les nouveaux à l'index
         for new_pair in new_pairs:
-            if new_pair.id in [asset.id for asset in self.loaded_assets]:
-                # Trouver et réactiver le token existant
-                for token in self.loaded_assets:
-                    if token.id == new_pair.id:
-                        token.active = True
-                        break
-            else:
-                # Ajouter le nouveau token s'il n'existe pas déjà
-                self.loaded_assets.append(new_pair)
-        # Désactiver les tokens non mentionnés dans la nouvelle liste
-        for token in self.loaded_assets:
-            if token.id not in [new_pair.id for new_pair in new_pairs]:
-                token.active = False
-
-    def refresh_currency_pairs_index(self):
-        for asset in self.loaded_assets:
-            if asset.id not in self.asset_search_index:
-                self.asset_search_index[asset.id] = asset
+            token = self.asset_search_index.setdefault(new_pair.id, new_pair)
+            token.active = True
+
+
+def iterate_json_array(file_path: str):
+    """
+    Parcourt les éléments d'un tableau JSON stocké dans un fichier, décodé d'un bloc depuis ses octets.
+
+    Args:
+        file_path (str): Le chemin du fichier JSON.
+
+    Returns:
+        Iterator: Les éléments du tableau.
+    """
+    with open(file_path, 'rb') as json_file:
+        content = json_file.read()
+    yield from json.loads(content)
+
+
+def write_json_string_list(file_path: LiteralString | str | bytes, values: list[str]):
+    """
+    Écrit une liste de chaînes au format JSON indenté (2 espaces), en une seule écriture.
+
+    Le résultat est identique à `json.dump(values, indent=2, sort_keys=True)` (sans objet, `sort_keys` n'a aucun
+    effet) mais chaque chaîne est encodée par l'encodeur C, au lieu de l'encodeur Python imposé par `indent`.
+
+    Args:
+        file_path (LiteralString | str | bytes): Le chemin du fichier à écrire.
+        values (list[str]): La liste de chaînes à sérialiser.
+    """
+    if values:
+        content = '[\n' + ',\n'.join(f'  {json.dumps(value)}' for value in values) + '\n]'
+    else:
+        content = '[]'
+    with open(file_path, 'w') as json_file:
+        json_file.write(content)
+
+
+def fetch_json_page(url: str):
+    """
+    Récupère et décode une page JSON de l'API web de gate.io.
+
+    Args:
+        url (str): L'URL de la page.
+
+    Returns:
+        Le contenu décodé de la page, ou None en cas d'erreur HTTP ou de réponse invalide.
+    """
+    response = http_session.get(url, timeout=http_timeout)
+    if response.status_code != 200:
+        logger.error(f'Request error: {response.status_code}')
+        return None
+    try:
+        # Décodage direct des octets : évite la détection d'encodage effectuée par response.json()
+        return json.loads(response.content)
+    except ValueError as error:
+        logger.error(f'Invalid JSON response from {url}: {error}')
+        return None
 
 
 def fetch_all_currency_pairs(file_path: LiteralString | str | bytes, number_of_pages: int, quote_currency: str = 'USDT'):
@@ -131,9 +289,66 @@ def fetch_all_currency_pairs(file_path: LiteralString | str | bytes, number_of_p
     gateio_proxy_instance = GateioProxy.get()
     all_currency_pairs = gateio_proxy_instance.list_currency_pairs()
     if len(all_currency_pairs):
-        with open(file_path, 'w') as json_file:
-            json.dump([currency_pair.id for currency_pair in all_currency_pairs], json_file, indent=2, sort_keys=True)
-            logger.info(f'Data successfully saved to {file_path}')
+        write_json_string_list(file_path, [currency_pair.id for currency_pair in all_currency_pairs])
+        logger.info(f'Data successfully saved to {file_path}')
+
+
+def fetch_listed_currency_pairs(file_path: LiteralString | str | bytes, number_of_pages: int, url_template: str, list_key: str,
+                                pair_from_item: Callable[[dict], Optional[str]]) -> list[str]:
+    """
+    Récupère une liste paginée de paires de devises depuis l'API web de gate.io et l'enregistre dans un fichier JSON.
+    Les pages sont récupérées en parallèle ; l'ordre des résultats suit celui des pages.
+
+    Args:
+        file_path (LiteralString | str | bytes): Le chemin vers le fichier où les données seront enregistrées.
+        number_of_pages (int): Nombre de pages à parcourir pour récupérer les données.
+        url_template (str): Modèle d'URL contenant le champ `{page_number}`.
+        list_key (str): Clé de la liste d'éléments dans `data` de la réponse.
+        pair_from_item (Callable[[dict], Optional[str]]): Convertit un élément en paire, ou None pour l'ignorer.
+
+    Returns:
+        list: Liste des paires de devises valides.
+    """
+    currency_pairs = []
+    urls = [url_template.format(page_number=page_number) for page_number in range(1, number_of_pages)]
+    # Exécuteur local et éphémère, plutôt que le pool partagé qui peut être saturé par la tâche appelante
+    with ThreadPoolExecutor(max_workers=max(1, min(len(urls), max_io_workers))) as executor:
+        pages = list(executor.map(fetch_json_page, urls))
+    for data in pages:
+        if data is None:
+            continue
+        for currency_item in data['data'][list_key]:
+            pair = pair_from_item(currency_item)
+            if pair is not None and verify_pair(pair):
+                currency_pairs.append(pair)
+
+    if len(currency_pairs):
+        write_json_string_list(file_path, currency_pairs)
+        logger.info(f'Data successfully saved to {file_path}')
+
+    return currency_pairs
+
+
+def pair_from_symbol(symbol_key: str, quote_currency: str) -> Callable[[dict], Optional[str]]:
+    """
+    Construit un convertisseur élément → paire `<SYMBOLE>/<QUOTE>`, qui ignore la devise de cotation elle-même.
+
+    Args:
+        symbol_key (str): Clé du symbole dans l'élément (ex. 'symbol', 'asset').
+        quote_currency (str): La devise de référence.
+
+    Returns:
+        Callable[[dict], Optional[str]]: Le convertisseur.
+    """
+
+    quote = quote_currency.upper()  # Calculé une seule fois, et non pour chaque élément
+    pair_suffix = '/' + quote  # Suffixe de paire précalculé, une seule concaténation par élément
+
+    def convert(currency_item: dict) -> Optional[str]:
+        symbol = currency_item[symbol_key].upper()
+        return symbol + pair_suffix if symbol != quote else None
+
+    return convert
 
 
 def fetch_popular_currency_pairs(file_path: LiteralString | str | bytes, number_of_pages: int, quote_currency: str = 'USDT'):
@@ -148,27 +363,9 @@ def fetch_popular_currency_pairs(file_path: LiteralString | str | bytes, number_
     Returns:
         list: Liste des paires de devises populaires.
     """
-    popular_currency_pairs = []
-    for page_number in range(1, number_of_pages):
-        url = f'https://www.gate.io/apiweb/v1/home/sortList?sortType=2&page={page_number}&pageSize=10'
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            currency_items = data['data']['sortList']
-            for currency_pair in currency_items:
-                if currency_pair['symbol'].upper() != quote_currency.upper():
-                    pair = currency_pair['symbol'].upper() + '/' + quote_currency.upper()
-                    if verify_pair(pair):
-                        popular_currency_pairs.append(pair)
-        else:
-            logger.error(f'Request error: {response.status_code}')
-
-    if len(popular_currency_pairs):
-        with open(file_path, 'w') as json_file:
-            json.dump(popular_currency_pairs, json_file, indent=2, sort_keys=True)
-            logger.info(f'Data successfully saved to {file_path}')
-
-    return popular_currency_pairs
+    return fetch_listed_currency_pairs(file_path, number_of_pages,
+                                       'https://www.gate.io/apiweb/v1/home/sortList?sortType=2&page={page_number}&pageSize=10',
+                                       'sortList', pair_from_symbol('symbol', quote_currency))
 
 
 def fetch_top_gainers(file_path: LiteralString | str | bytes, number_of_pages: int, quote_currency: str = 'USDT'):
@@ -183,27 +380,9 @@ def fetch_top_gainers(file_path: LiteralString | str | bytes, number_of_pages: i
     Returns:
         list: Liste des paires de devises ayant les meilleures performances.
     """
-    top_gainers_currency_pairs = []
-    for page_number in range(1, number_of_pages):
-        url = f'https://www.gate.io/apiweb/v1/home/sortList?sortType=1&page={page_number}&pageSize=10'
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            currency_items = data['data']['sortList']
-            for currency_pair in currency_items:
-                if currency_pair['symbol'].upper() != quote_currency.upper():
-                    pair = currency_pair['symbol'].upper() + '/' + quote_currency.upper()
-                    if verify_pair(pair):
-                        top_gainers_currency_pairs.append(pair)
-        else:
-            logger.error(f'Request error: {response.status_code}')
-
-    if len(top_gainers_currency_pairs):
-        with open(file_path, 'w') as json_file:
-            json.dump(top_gainers_currency_pairs, json_file, indent=2, sort_keys=True)
-            logger.info(f'Data successfully saved to {file_path}')
-
-    return top_gainers_currency_pairs
+    return fetch_listed_currency_pairs(file_path, number_of_pages,
+                                       'https://www.gate.io/apiweb/v1/home/sortList?sortType=1&page={page_number}&pageSize=10',
+                                       'sortList', pair_from_symbol('symbol', quote_currency))
 
 
 def fetch_most_profitable_currency_pairs(file_path: LiteralString | str | bytes, number_of_pages: int, quote_currency: str = 'USDT'):
@@ -218,27 +397,9 @@ def fetch_most_profitable_currency_pairs(file_path: LiteralString | str | bytes,
     Returns:
         list: Liste des paires de devises les plus rentables.
     """
-    most_profitable_currency_pairs = []
-    for page_number in range(1, number_of_pages):
-        url = f'https://www.gate.io/api/web/v1/site/getHomeCoinList?type=6&page={page_number}&pageSize=10'
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            currency_items = data['data']['list']
-            for currency_pair in currency_items:
-                if currency_pair['asset'].upper() != quote_currency.upper():
-                    pair = currency_pair['asset'].upper() + '/' + quote_currency.upper()
-                    if verify_pair(pair):
-                        most_profitable_currency_pairs.append(pair)
-        else:
-            logger.error(f'Request error: {response.status_code}')
-
-    if len(most_profitable_currency_pairs):
-        with open(file_path, 'w') as json_file:
-            json.dump(most_profitable_currency_pairs, json_file, indent=2, sort_keys=True)
-            logger.info(f'Data successfully saved to {file_path}')
-
-    return most_profitable_currency_pairs
+    return fetch_listed_currency_pairs(file_path, number_of_pages,
+                                       'https://www.gate.io/api/web/v1/site/getHomeCoinList?type=6&page={page_number}&pageSize=10',
+                                       'list', pair_from_symbol('asset', quote_currency))
 
 
 def fetch_trending_currency_pairs(file_path: LiteralString | str | bytes, number_of_pages: int):
@@ -252,26 +413,9 @@ def fetch_trending_currency_pairs(file_path: LiteralString | str | bytes, number
     Returns:
         list: Liste des paires de devises en tendance.
     """
-    trending_currency_pairs = []
-    for page_number in range(1, number_of_pages):
-        url = f'https://www.gate.io/apiweb/v1/home/getCoinList?type=1&page={page_number}&pageSize=10&subType=1'
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            market_items = data['data']['marketList']
-            for currency_pair in market_items:
-                pair = currency_pair['pair'].upper().replace('_', '/')
-                if verify_pair(pair):
-                    trending_currency_pairs.append(pair)
-        else:
-            logger.error(f'Request error: {response.status_code}')
-
-    if len(trending_currency_pairs):
-        with open(file_path, 'w') as json_file:
-            json.dump(trending_currency_pairs, json_file, indent=2, sort_keys=True)
-            logger.info(f'Data successfully saved to {file_path}')
-
-    return trending_currency_pairs
+    return fetch_listed_currency_pairs(file_path, number_of_pages,
+                                       'https://www.gate.io/apiweb/v1/home/getCoinList?type=1&page={page_number}&pageSize=10&subType=1',
+                                       'marketList', lambda currency_item: currency_item['pair'].upper().replace('_', '/'))
 
 
 """
@@ -21,6 +21,8 @@ class Track:
     | `self.sell`                | `sell_order_tracking`               | Suivi de l'ordre de vente                          |
     """
 
+    __slots__ = ('buy_order_tracking', 'sell_order_tracking')  # Attributs fixes : pas de __dict__ par instance
+
     class OrderTrack:
         """
         Classe interne pour suivre un ordre spécifique.
@@ -29,6 +31,8 @@ class Track:
         et le prix auquel l'ordre est placé.
         """
 
+        __slots__ = ('tracked_order', 'tracked_price')  # Attributs fixes : pas de __dict__ par instance
+
         def __init__(self):
             """
             Initialise une instance de OrderTrack avec un ordre vide et un prix de zéro.
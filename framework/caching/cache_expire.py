@@ -1,3 +1,5 @@
+import heapq
+import itertools
 import time
 
 
@@ -11,43 +13,43 @@ class CacheExpire:
     ### Correspondance des noms (Ancien → Nouveau → Signification)
     | Ancien Nom              | Nouveau Nom                         | Signification                                                    |
     |-------------------------|-------------------------------------|------------------------------------------------------------------|
-    | `self.cache`            | `cached_data`                       | Dictionnaire pour stocker les données mises en cache             |
-    | `self.expire_times`     | `expiration_timestamps`             | Dictionnaire pour stocker les moments d'expiration des clés      |
+    | `self.cache`            | `cache_entries`                     | Dictionnaire des valeurs mises en cache et de leur expiration    |
+    | `self.expire_times`     | `cache_entries`                     | Fusionné avec les valeurs dans un tuple (valeur, expiration)     |
     | `set`                   | `set_value_with_expiration`         | Ajoute une valeur au cache avec une expiration                   |
     | `get`                   | `get_value_if_not_expired`          | Récupère une valeur si elle n'a pas expiré, sinon la supprime    |
     """
 
+    purge_interval = 128  # Nombre d'insertions entre deux purges opportunistes des clés expirées
+
     def __init__(self):
         """
-        Initialise une instance de CacheExpire avec deux dictionnaires :
-        - `cached_data` pour stocker les paires clé-valeur.
-        - `expiration_timestamps` pour stocker les moments d'expiration de chaque clé.
+        Initialise une instance de CacheExpire avec un dictionnaire unique `cache_entries` associant à chaque clé
+        un tuple (valeur, moment d'expiration). Une seule opération sur le dictionnaire suffit ainsi à lire ou écrire
+        une entrée, ce qui reste cohérent en cas d'accès concurrents sans nécessiter de verrou.
         """
-        self.cached_data = {}  # Dictionnaire pour stocker les données mises en cache
-        self.expiration_timestamps = {}  # Dictionnaire pour stocker les moments d'expiration des clés
+        self.cache_entries: dict = {}  # Dictionnaire clé → (valeur, moment d'expiration monotone)
+        self.expiration_queue: list = []  # Tas (expiration, numéro d'ordre, clé) pour purger les clés jamais relues
+        self.insertion_sequence = itertools.count()  # Départage les expirations égales sans comparer les clés
+        self.insertions_since_purge = 0
 
-    def set_value_with_expiration(self, key, value, expire_in_seconds: int):
+    def set_value_with_expiration(self, key, value, expire_in_seconds: float):
         """
         Ajoute une valeur au cache avec une clé spécifiée et définit un temps d'expiration pour cette clé.
 
         Paramètres :
         key : La clé à utiliser pour stocker la valeur.
         value : La valeur à stocker dans le cache.
-        expire_in_seconds (int) : Le temps en secondes après lequel la clé expire.
-
-        Remarque :
-        Si le temps d'expiration est défini dans le passé (expire_in_seconds est inférieur au temps actuel),
-        une variable d'erreur non utilisée est définie (peut-être pour une future gestion d'erreur ou de log).
+        expire_in_seconds (float) : Le temps en secondes après lequel la clé expire (les fractions de seconde sont acceptées).
         """
-        if expire_in_seconds > time.time():
-            # noinspection PyUnusedLocal
-            error = True  # Indicateur que quelque chose ne va pas (potentiellement à gérer plus tard)
+        # Horloge monotone : insensible aux ajustements de l'heure système
+        expiration_timestamp = time.monotonic() + expire_in_seconds
+        self.cache_entries[key] = (value, expiration_timestamp)
+        heapq.heappush(self.expiration_queue, (expiration_timestamp, next(self.insertion_sequence), key))
 
-        # Stocke la valeur dans le cache
-        self.cached_data[key] = value
-
-        # Définir le moment d'expiration pour la clé, en fonction du temps d'expiration spécifié
-        self.expiration_timestamps[key] = time.time() + expire_in_seconds
+        # Purge amortie : le coût est réparti sur les insertions
+        self.insertions_since_purge += 1
+        if self.insertions_since_purge >= self.purge_interval:
+            self.purge_expired_values()
 
     def get_value_if_not_expired(self, key):
         """
@@ -59,14 +61,27 @@ class CacheExpire:
         Retourne :
         La valeur associée à la clé si elle est encore valide, sinon None.
         """
-        if key in self.cached_data:
-            # Vérifie si la clé a expiré
-            if time.time() >= self.expiration_timestamps[key]:
-                # Supprime la clé et sa valeur associée du cache si elle a expiré
-                del self.cached_data[key]
-                del self.expiration_timestamps[key]
-                return None
-            else:
-                # Retourne la valeur si elle est encore valide
-                return self.cached_data[key]
-        return None
+        cache_entry = self.cache_entries.get(key)
+        if cache_entry is None:
+            return None
+        value, expiration_timestamp = cache_entry
+        if time.monotonic() >= expiration_timestamp:
+            # Supprime la clé du cache si elle a expiré (sans erreur si un autre thread l'a déjà supprimée)
+            self.cache_entries.pop(key, None)
+            return None
+        return value
+
+    def purge_expired_values(self):
+        """
+        Supprime du cache toutes les clés expirées, y compris celles qui ne sont plus jamais consultées.
+
+        Une clé n'est supprimée que si l'entrée du tas correspond toujours à son expiration courante : une clé
+        redéfinie entre-temps avec une nouvelle expiration est conservée.
+        """
+        self.insertions_since_purge = 0
+        now = time.monotonic()
+        while self.expiration_queue and self.expiration_queue[0][0] <= now:
+            expiration_timestamp, _, key = heapq.heappop(self.expiration_queue)
+            cache_entry = self.cache_entries.get(key)
+            if cache_entry is not None and cache_entry[1] == expiration_timestamp:
+                self.cache_entries.pop(key, None)
@@ -1,4 +1,5 @@
-from typing import Literal, Optional, Self
+from functools import partial
+from typing import Any, Callable, Literal, Optional, Self
 
 from framework.caching.cache_expire import CacheExpire
 from framework.tooling.tooling_utils import timeframe_to_seconds, get_seconds_till_close
@@ -25,6 +26,9 @@ class CacheExpireManager:
     | `__compute_timeout_in_seconds` | `calculate_cache_timeout_in_seconds`   | Calcule le délai d'expiration en fonction de la politique       |
     """
 
+    __slots__ = ('cache_manager', 'cache_identifier', 'default_cache_timeout', 'is_timeframe_based', 'timeframe_duration_in_seconds',
+                 'cached_value', 'is_cache_miss', 'timeout_function')  # Attributs fixes : pas de __dict__ par instance
+
     def __init__(self, cache_expire: CacheExpire, cache_key: str, timeout_in_seconds: int):
         """
         Initialise le gestionnaire de cache avec les paramètres spécifiés.
@@ -40,6 +44,8 @@ class CacheExpireManager:
         self.is_timeframe_based = False  # Indicateur si le cache est déclenché par un intervalle de temps spécifique
         self.timeframe_duration_in_seconds = None  # Intervalle de temps en secondes (si applicable)
         self.cached_value = None  # Valeur à mettre en cache ou à récupérer
+        self.is_cache_miss = False  # Indique si la valeur était absente du cache à l'entrée du bloc
+        self.timeout_function = lambda: timeout_in_seconds  # Calcul du délai d'expiration, fixé par la politique de cache
 
     def set_caching_policy(self, cache_mode: Literal['system', 'random', 'close'], timeframe: Optional[GateioTimeFrame]) -> Self:
         """
@@ -55,42 +61,81 @@ class CacheExpireManager:
         if cache_mode == 'close':
             self.is_timeframe_based = True  # Active le mode basé sur le timeframe
             self.timeframe_duration_in_seconds = timeframe_to_seconds(timeframe)  # Convertit le timeframe en secondes
+            # Le délai d'expiration est lié une fois pour toutes à la clôture du timeframe
+            self.timeout_function = partial(get_seconds_till_close, self.timeframe_duration_in_seconds)
         return self
 
     def __enter__(self):
         """
         Gestionnaire de contexte pour récupérer la valeur du cache à l'entrée du bloc.
 
+        La valeur récupérée est lue sur l'instance : `with CacheExpireManager(...) as manager: value = manager.cached_value`
+        (remplace l'ancienne forme `as (manager, value)`).
+
         Returns:
-            tuple: Retourne l'instance elle-même et la valeur récupérée du cache.
+            CacheExpireManager: L'instance elle-même, dont `cached_value` contient la valeur récupérée du cache.
         """
         self.cached_value = self.cache_manager.get_value_if_not_expired(self.cache_identifier)  # Récupère la valeur du cache
-        return self, self.cached_value
+        self.is_cache_miss = self.cached_value is None  # Mémorise l'absence pour éviter une seconde lecture à la sortie
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Gestionnaire de contexte pour mettre en cache la valeur à la sortie du bloc, si nécessaire.
 
+        La valeur n'est écrite que si elle était absente du cache à l'entrée du bloc, que l'appelant
+        l'a affectée à `cached_value` dans le bloc, que le bloc n'a pas levé d'exception et que
+        `skip_cache` n'a pas été appelée.
+
         Args:
             exc_type: Le type de l'exception levée (si existant).
             exc_val: La valeur de l'exception levée (si existant).
             exc_tb: La traceback de l'exception levée (si existant).
         """
-        if self.cache_manager.get_value_if_not_expired(self.cache_identifier) is None:  # Vérifie si la valeur est absente du cache
-            expire_in_seconds = self.calculate_cache_timeout_in_seconds()  # Calcule le délai d'expiration
+        if exc_type is None and self.is_cache_miss and self.cached_value is not None:  # Valeur absente à l'entrée et calculée dans le bloc
+            expire_in_seconds = self.timeout_function()  # Délai d'expiration selon la politique, sans branchement
             # Met en cache la valeur avec le temps d'expiration calculé
             self.cache_manager.set_value_with_expiration(key=self.cache_identifier, value=self.cached_value, expire_in_seconds=expire_in_seconds)
 
+    def skip_cache(self):
+        """
+        Empêche l'écriture de la valeur dans le cache à la sortie du bloc `with` en cours.
+        """
+        self.is_cache_miss = False
+
+    def get_or_compute(self, producer: Callable[[], Any]) -> Any:
+        """
+        Retourne la valeur du cache, ou la calcule et la met en cache si elle est absente ou expirée.
+
+        Cette méthode est à privilégier sur la forme `with` lorsque la valeur se calcule par une simple fonction :
+        elle évite le protocole de gestionnaire de contexte.
+
+        Comme pour la forme `with`, une valeur None n'est pas mise en cache : None signale l'absence de valeur.
+
+        Args:
+            producer (Callable[[], Any]): Fonction sans argument calculant la valeur en cas d'absence dans le cache.
+
+        Returns:
+            Any: La valeur en cache ou nouvellement calculée.
+        """
+        cached_value = self.cache_manager.get_value_if_not_expired(self.cache_identifier)
+        if cached_value is not None:
+            return cached_value
+        cached_value = producer()
+        if cached_value is not None:
+            self.cache_manager.set_value_with_expiration(key=self.cache_identifier, value=cached_value,
+                                                         expire_in_seconds=self.timeout_function())
+        return cached_value
+
     def calculate_cache_timeout_in_seconds(self):
         """
         Calcule le temps d'expiration basé sur la politique fixée.
 
+        La fonction de calcul est choisie par `set_caching_policy` : délai par défaut, ou temps restant
+        jusqu'à la clôture du timeframe. Conservée pour compatibilité : `__exit__` et `get_or_compute`
+        appellent directement `timeout_function`.
+
         Returns:
             int: Le nombre de secondes avant expiration du cache.
         """
-        if not self.is_timeframe_based:
-            timeout = self.default_cache_timeout  # Utilise le délai d'expiration par défaut
-        else:
-            seconds_till_close = get_seconds_till_close(self.timeframe_duration_in_seconds)  # Calcule le temps restant jusqu'à la clôture du timeframe
-            timeout = seconds_till_close  # Utilise ce temps comme délai d'expiration
-        return timeout
+        return self.timeout_function()
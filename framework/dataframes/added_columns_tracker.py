@@ -11,13 +11,15 @@ class AddedColumnsTracker:
     |-------------------|--------------------|----------------------------------------------------------------------------|
     | `dataframe`       | `dataframe`        | DataFrame à surveiller pour détecter les nouvelles colonnes ajoutées       |
     | `target_set`      | `target_set`       | Ensemble où les nouvelles colonnes seront enregistrées                     |
-    | `initial_columns` | `initial_columns`  | Ensemble des colonnes existantes avant l'ajout de nouvelles colonnes       |
+    | `initial_columns` | `initial_columns`  | Ensemble figé des colonnes existantes avant l'ajout de nouvelles colonnes  |
     | `new_columns`     | `new_columns`      | Colonnes ajoutées au DataFrame pendant l'exécution du bloc                 |
 
     Cette classe permet de surveiller les colonnes qui sont ajoutées au DataFrame et
     d'enregistrer ces nouvelles colonnes dans un ensemble cible (`target_set`).
     """
 
+    __slots__ = ('dataframe', 'target_set', 'initial_columns')  # Attributs fixes : pas de __dict__ par instance
+
     def __init__(self, dataframe: DataFrame, target_set: set[str]):
         """
         Initialise une instance de NewColumnsTracker.
@@ -29,7 +31,7 @@ class AddedColumnsTracker:
         self.dataframe = dataframe
         self.target_set = target_set
         # Stocke les colonnes initiales du DataFrame
-        self.initial_columns = set(dataframe.columns)
+        self.initial_columns = frozenset(dataframe.columns)
 
     def __enter__(self):
         """
@@ -52,7 +54,9 @@ class AddedColumnsTracker:
         exc_val : Valeur de l'exception.
         exc_tb : Traceback de l'exception.
         """
-        # Calcule la différence entre les colonnes actuelles et les colonnes initiales
-        new_columns = set(self.dataframe.columns) - self.initial_columns
+        # Sélectionne les colonnes actuelles absentes des colonnes initiales, sans construire d'ensemble complet
+        initial_columns = self.initial_columns
+        new_columns = [column for column in self.dataframe.columns if column not in initial_columns]
         # Met à jour l'ensemble cible avec les nouvelles colonnes détectées
-        self.target_set.update(new_columns)
+        if new_columns:
+            self.target_set.update(new_columns)
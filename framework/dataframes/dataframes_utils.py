@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from pandas import DataFrame
 
 from framework.dataframes.temporary_columns_manager import TemporaryColumnsManager
@@ -6,8 +8,11 @@ from framework.dataframes.temporary_columns_manager import TemporaryColumnsManag
 
 def adjust_column_values_within_limits(dataframe: DataFrame, column: str, lower_limit: float, upper_limit: float, max_iterations=100):
     """
-    Ajuste les valeurs d'une colonne spécifique d'un DataFrame de manière itérative afin de minimiser le nombre de points
-    qui se situent au-dessus ou en dessous des seuils spécifiés (upper_limit et lower_limit).
+    Décale les valeurs d'une colonne spécifique d'un DataFrame afin d'équilibrer le nombre de points qui se situent
+    au-dessus et en dessous des seuils spécifiés (upper_limit et lower_limit).
+
+    Le décalage est obtenu par dichotomie sur la colonne triée une seule fois, plutôt que par ajustements successifs
+    de toute la colonne.
 
     ### Correspondance des noms (Ancien → Nouveau → Signification)
     | Ancien Nom          | Nouveau Nom                          | Signification                                                              |
@@ -17,21 +22,39 @@ def adjust_column_values_within_limits(dataframe: DataFrame, column: str, lower_
     | `column`            | `column`                             | La colonne du DataFrame à ajuster.                                         |
     | `bottom`            | `lower_limit`                        | La limite inférieure pour les valeurs de la colonne.                       |
     | `top`               | `upper_limit`                        | La limite supérieure pour les valeurs de la colonne.                       |
-    | `iterations`        | `max_iterations`                     | Le nombre maximal d'itérations pour ajuster les valeurs (par défaut 100).  |
+    | `iterations`        | `max_iterations`                     | Le nombre maximal d'itérations de la dichotomie (par défaut 100).          |
     """
-    total_adjustment = 0.0
-    done = False
-    i = 0
-    while not done and i <= max_iterations:
-        above_max = dataframe[column] > upper_limit
-        below_min = dataframe[column] < lower_limit
-        surface_above = above_max.sum()
-        surface_below = below_min.sum()
-        adjustment = 50.0 * (surface_above - surface_below) / len(dataframe)
-        dataframe[column] = dataframe[column] - adjustment
-        total_adjustment = total_adjustment + adjustment
-        done = (surface_above == surface_below)
-        i = i + 1
+    values = dataframe[column].to_numpy(dtype=float)
+    # Tri unique : les effectifs au-dessus et en dessous des limites s'obtiennent ensuite par recherche dichotomique
+    sorted_values = np.sort(values[~np.isnan(values)])
+
+    def count_imbalance(offset: float) -> int:
+        # Nombre de points au-dessus de la limite haute moins nombre de points sous la limite basse, après décalage
+        surface_above = len(sorted_values) - np.searchsorted(sorted_values, upper_limit + offset, side='right')
+        surface_below = np.searchsorted(sorted_values, lower_limit + offset, side='left')
+        return int(surface_above - surface_below)
+
+    imbalance = count_imbalance(0.0)
+    if imbalance == 0:
+        return dataframe[column]
+    # Le déséquilibre décroît avec le décalage : recherche du décalage qui l'annule par dichotomie
+    if imbalance > 0:
+        offset_low, offset_high = 0.0, sorted_values[-1] - upper_limit
+    else:
+        offset_low, offset_high = sorted_values[0] - lower_limit, 0.0
+    best_offset, best_imbalance = 0.0, abs(imbalance)
+    for _ in range(max_iterations):
+        offset = (offset_low + offset_high) / 2.0
+        imbalance = count_imbalance(offset)
+        if abs(imbalance) < best_imbalance:
+            best_offset, best_imbalance = offset, abs(imbalance)
+        if imbalance == 0:
+            break
+        if imbalance > 0:
+            offset_low = offset
+        else:
+            offset_high = offset
+    dataframe[column] = dataframe[column] - best_offset
     return dataframe[column]
 
 
@@ -50,12 +73,16 @@ def flag_rows_with_consecutive_true_values(df: DataFrame, columns: list, consecu
     """
     consecutive = 'consecutive'
     with TemporaryColumnsManager(dataframe=df, drop=[]) as df:
-        df[consecutive] = False
-        cols_positions = [df.columns.get_loc(col) for col in columns]
-        for i in range(len(df) - consecutive_window + 1):
-            all_true_in_consecutive_rows = all(df.iloc[i + j, cols_positions].all() for j in range(consecutive_window))
-            if all_true_in_consecutive_rows:
-                df.iloc[i:i + consecutive_window, df.columns.get_loc(consecutive)] = True
+        rows_all_true = df[columns].to_numpy(dtype=bool).all(axis=1)
+        if consecutive_window <= 0 or len(rows_all_true) < consecutive_window:
+            df[consecutive] = False
+            return df
+        # Une fenêtre débutant à la ligne i est valide si ses 'consecutive_window' lignes sont toutes à True (vue sans copie)
+        valid_window_starts = sliding_window_view(rows_all_true, consecutive_window).all(axis=1)
+        # Une ligne est marquée si une fenêtre valide la couvre, c'est-à-dire débute dans les 'consecutive_window' lignes précédentes
+        window_padding = np.zeros(consecutive_window - 1, dtype=bool)
+        padded_window_starts = np.concatenate((window_padding, valid_window_starts, window_padding))
+        df[consecutive] = sliding_window_view(padded_window_starts, consecutive_window).any(axis=1)
     return df
 
 
@@ -70,10 +97,9 @@ def set_timestamp_as_index(dataframe: DataFrame):
     | `dataframe`       | `dataframe`                | Le DataFrame à traiter.                                                    |
     """
 
-    def remove_duplicate_indices(df):
-        df = df[~df.index.duplicated(keep='first')]
-        return df
-
-    dataframe.loc[:, 'timestamp'] = pd.to_datetime(dataframe['timestamp'], utc=True)
-    dataframe = dataframe.set_index('timestamp')
-    return remove_duplicate_indices(dataframe)
+    # Construction directe de l'index, sans réécrire la colonne ni passer par set_index
+    timestamp_index = pd.DatetimeIndex(pd.to_datetime(dataframe['timestamp'], utc=True), name='timestamp')
+    dataframe = dataframe.drop(columns='timestamp')
+    dataframe.index = timestamp_index
+    # Supprime les doublons d'index en conservant la première occurrence
+    return dataframe[~timestamp_index.duplicated(keep='first')]
@@ -38,6 +38,7 @@ class JapaneseDataframe(DataFrame):
 
         Retourne :
         JapaneseDataframe : Une nouvelle instance de JapaneseDataframe avec les mêmes données, index et colonnes que le DataFrame d'origine.
+        Les données ne sont pas copiées : l'instance partage les tableaux sous-jacents de `df` et conserve les types de chaque colonne.
         """
-        # Utilise les valeurs, l'index et les colonnes du DataFrame existant pour créer une nouvelle instance de JapaneseDataframe
-        return cls(df.values, index=df.index, columns=df.columns)
+        # Construit l'instance à partir des blocs du DataFrame existant, sans passer par un tableau 2D intermédiaire
+        return cls(df, copy=False).__finalize__(df)
@@ -1,6 +1,7 @@
 import warnings
 
-from pandas import DataFrame
+from pandas import DataFrame, Index
+from pandas.errors import PerformanceWarning, SettingWithCopyWarning
 
 
 class TemporaryColumnsManager:
@@ -20,6 +21,8 @@ class TemporaryColumnsManager:
     | `__exit__`         | `__exit__`         | Méthode pour supprimer ou conserver les colonnes après l'opération contextuelle   |
     """
 
+    __slots__ = ('df', 'keep_temp_columns', 'drop_temp_columns')  # Attributs fixes : pas de __dict__ par instance
+
     def __init__(self, dataframe: DataFrame, keep: list = None, drop: list = None):
         """
         Initialise le gestionnaire de colonnes avec les colonnes à conserver et à supprimer.
@@ -41,14 +44,17 @@ class TemporaryColumnsManager:
         Retourne :
         DataFrame : Le DataFrame avec les colonnes temporaires ajoutées (si nécessaire).
         """
-        # Ajoute les colonnes temporaires (si elles n'existent pas déjà) sans initialiser de données
-        for column_name in self.keep_temp_columns + self.drop_temp_columns:
-            if column_name not in self.df.columns:
-                # Utilise un gestionnaire de contextes pour ignorer les avertissements
-                with warnings.catch_warnings():
-                    warnings.simplefilter('ignore')
-                    # Ajoute la colonne temporaire avec des valeurs None
-                    self.df.loc[:, column_name] = None
+        # Détermine en une passe les colonnes temporaires absentes du DataFrame (sans doublons, dans l'ordre)
+        existing_columns = self.df.columns
+        missing_columns = [column_name for column_name in dict.fromkeys(self.keep_temp_columns + self.drop_temp_columns)
+                           if column_name not in existing_columns]
+        if missing_columns:
+            # Ignore uniquement les avertissements d'écriture sur une copie et de fragmentation (si des colonnes sont ajoutées)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', SettingWithCopyWarning)
+                warnings.simplefilter('ignore', PerformanceWarning)
+                # Ajoute toutes les colonnes temporaires en une seule affectation, avec des valeurs None
+                self.df[missing_columns] = None
         return self.df
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -62,8 +68,15 @@ class TemporaryColumnsManager:
         """
         # Si la liste drop_temp_columns n'est pas vide, on supprime ces colonnes du DataFrame
         if self.drop_temp_columns:
-            self.df.drop(columns=self.drop_temp_columns, inplace=True)
+            # Sans doublons, en ignorant les colonnes déjà supprimées pendant le bloc
+            existing_columns = self.df.columns
+            columns_to_drop = [column_name for column_name in dict.fromkeys(self.drop_temp_columns) if column_name in existing_columns]
         else:
             # Sinon, on conserve uniquement les colonnes spécifiées dans keep_temp_columns
-            columns = self.df.columns
-            self.df.drop(columns=columns.difference(self.keep_temp_columns), inplace=True)
+            # Différence calculée directement entre index, sans tri des colonnes restantes
+            columns_to_drop = self.df.columns.difference(Index(self.keep_temp_columns), sort=False)
+        if len(columns_to_drop):
+            # Un seul drop en place, en ignorant uniquement l'avertissement d'écriture sur une copie
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', SettingWithCopyWarning)
+                self.df.drop(columns=columns_to_drop, inplace=True)
@@ -9,6 +9,8 @@ class GenericEvent(dict):
     pour stocker des paires clé-valeur représentant des attributs de l'événement.
     """
 
+    __slots__ = ()  # Les attributs de l'événement sont les clés du dictionnaire : pas de __dict__ par instance
+
     def __init__(self, *args, **kwargs):
         """
         Initialise une instance de GenericEvent en appelant le constructeur de la classe parent `dict`.
@@ -0,0 +1,57 @@
+import threading
+from logging.handlers import MemoryHandler
+
+
+class BufferedLogHandler(MemoryHandler):
+    """
+    Sous-classe de MemoryHandler accumulant les enregistrements de log avant de les transmettre à un gestionnaire cible.
+
+    Les enregistrements sont transmis par lots : lorsque le tampon est plein, lorsqu'un enregistrement atteint le niveau
+    de vidage, ou au plus tard toutes les `flush_interval` secondes grâce à un thread de vidage périodique (y compris
+    lorsque plus aucun log n'est émis). Si la cible sait écrire un lot d'enregistrements (`emit_records`), le lot est
+    écrit avec un seul vidage du fichier au lieu d'un par enregistrement.
+    """
+
+    def __init__(self, capacity, flush_level, target, flush_interval=5.0):
+        """
+        Initialise une nouvelle instance de BufferedLogHandler et démarre son thread de vidage périodique.
+
+        Args:
+            capacity (int): Le nombre d'enregistrements conservés avant un vidage.
+            flush_level (int): Le niveau à partir duquel un enregistrement provoque un vidage immédiat.
+            target (logging.Handler): Le gestionnaire recevant les enregistrements.
+            flush_interval (float): Le délai maximal, en secondes, pendant lequel un enregistrement reste dans le tampon.
+        """
+        super(BufferedLogHandler, self).__init__(capacity, flushLevel=flush_level, target=target)
+        self.flush_interval = flush_interval
+        self.stop_event = threading.Event()
+        # Thread démon : il ne retarde pas l'arrêt du processus, logging.shutdown vide le tampon à la sortie
+        self.flush_thread = threading.Thread(target=self.flush_periodically, name='BufferedLogHandler', daemon=True)
+        self.flush_thread.start()
+
+    def flush_periodically(self):
+        """
+        Vide le tampon toutes les `flush_interval` secondes, jusqu'à la fermeture du gestionnaire.
+        """
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """
+        Transmet les enregistrements du tampon au gestionnaire cible, en un seul lot si possible.
+        """
+        with self.lock:
+            if self.target and self.buffer:
+                if hasattr(self.target, 'emit_records'):
+                    self.target.emit_records(self.buffer)
+                else:
+                    for record in self.buffer:
+                        self.target.handle(record)
+                self.buffer.clear()
+
+    def close(self):
+        """
+        Arrête le thread de vidage périodique, puis vide le tampon et ferme le gestionnaire.
+        """
+        self.stop_event.set()
+        super(BufferedLogHandler, self).close()
@@ -26,8 +26,8 @@ class CurrencyLogger(logging.Logger):
             currency_pair (BotCurrencyPair): La paire de devises associée au message de journalisation.
             message (str): Le message à journaliser.
         """
-        # Utilise la méthode warning de Logger pour journaliser un message au niveau WARNING
-        self.warning(f'{currency_pair} : {message}')
+        # Formatage différé : le message n'est construit que si un gestionnaire l'émet
+        self.warning('%s : %s', currency_pair, message)
 
     def log_currency_info(self, currency_pair: BotCurrencyPair, message):
         """
@@ -37,5 +37,5 @@ class CurrencyLogger(logging.Logger):
             currency_pair (BotCurrencyPair): La paire de devises associée au message de journalisation.
             message (str): Le message à journaliser.
         """
-        # Utilise la méthode info de Logger pour journaliser un message au niveau INFO
-        self.info(f'{currency_pair} : {message}')
+        # Formatage différé : le message n'est construit que si un gestionnaire l'émet
+        self.info('%s : %s', currency_pair, message)
@@ -3,8 +3,9 @@ import subprocess
 import threading
 import traceback
 import warnings
-from functools import wraps
+from functools import lru_cache, wraps
 
+from framework.logs.buffered_log_handler import BufferedLogHandler
 from framework.logs.currency_logger import CurrencyLogger
 from framework.logs.no_deprecation_warning import NoDeprecationWarning
 from framework.logs.no_urllib3_warning import NoUrllib3Warning
@@ -28,9 +29,11 @@ class LoggingTools:
     """
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def retrieve_logging_configuration():
         """
         Récupère les paramètres de configuration du logging à partir du fichier YAML.
+        La configuration étant figée après son chargement, le résultat est calculé une seule fois.
 
         Returns:
             tuple: Un tuple contenant:
@@ -138,10 +141,15 @@ logging.getLogger('urllib3.connectionpool').setLevel(logging_exceptions)
 logging.getLogger('werkzeug').setLevel(logging_exceptions)
 
 if enabled and file != '':
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    # Le gestionnaire de fichier est la cible du tampon : son format doit être défini explicitement
+    file_handler = RotatingLogger(filename=file, when='midnight', interval=1, backup_count=5)
+    file_handler.setFormatter(logging.Formatter(log_format))
     logging.basicConfig(level=logging_level,
-                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        format=log_format,
                         handlers=[
-                            RotatingLogger(filename=file, when='midnight', interval=1, backup_count=5),
+                            # Écritures du fichier de log regroupées par lots, vidées immédiatement à partir du niveau WARNING
+                            BufferedLogHandler(capacity=1024, flush_level=logging.WARNING, target=file_handler),
                             logging.StreamHandler()
                         ])
 
@@ -30,6 +30,7 @@ class RotatingLogger(TimedRotatingFileHandler):
         # Sépare le répertoire et le nom de fichier du chemin donné
         self.dir_log, self.file_name = os.path.split(filename)
         self.prefix = None  # Initialise le préfixe à None
+        self.is_flush_deferred = False  # Vrai pendant l'écriture d'un lot : le fichier n'est vidé qu'à la fin du lot
         filename = self.compute_filename()  # Calcule le nom de fichier avec préfixe de date
         # Appelle le constructeur de la classe parente avec le nouveau nom de fichier
         super(RotatingLogger, self).__init__(
@@ -48,6 +49,30 @@ class RotatingLogger(TimedRotatingFileHandler):
         filename = self.prefix + self.file_name
         return filename
 
+    def flush(self):
+        """
+        Vide le flux du fichier de log, sauf pendant l'écriture d'un lot d'enregistrements.
+        """
+        if not self.is_flush_deferred:
+            super(RotatingLogger, self).flush()
+
+    def emit_records(self, records):
+        """
+        Écrit un lot d'enregistrements de log avec un seul vidage du fichier à la fin du lot.
+
+        Args:
+            records (list[logging.LogRecord]): Les enregistrements à écrire.
+        """
+        self.acquire()
+        try:
+            self.is_flush_deferred = True
+            for record in records:
+                self.handle(record)
+        finally:
+            self.is_flush_deferred = False
+            self.flush()
+            self.release()
+
     def doRollover(self):
         """
         Effectue la rotation des fichiers de log.
@@ -1,10 +1,22 @@
 import argparse
+import json
 import os
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeYamlLoader  # Analyseur C (libyaml)
+except ImportError:
+    from yaml import SafeLoader as SafeYamlLoader
+
+
+class ConfigurationYamlLoader(SafeYamlLoader):
+    """
+    Chargeur YAML des fichiers de configuration, propre à cette classe pour y enregistrer la directive `!include`.
+    """
+
 
 class Parameters:
     """
@@ -31,8 +43,11 @@ class Parameters:
     script_path = None
     singleton_instance = None
     yaml = {}
+    included_files = []
+    included_configurations = {}  # Fichiers inclus déjà analysés, par (chemin absolu, horodatage de modification)
 
     @staticmethod
+    @lru_cache(maxsize=4)
     def find_git_root_directory(path):
         """
         Trouve le répertoire racine du dépôt git contenant le chemin spécifié.
@@ -43,41 +58,56 @@ class Parameters:
         Returns:
             str or None: Le chemin vers le répertoire racine du dépôt git ou None si non trouvé.
         """
-        try:
-            git_root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'], cwd=path, text=True).strip()
-            return git_root
-        except subprocess.CalledProcessError:
-            return None
+        # Remonte l'arborescence jusqu'au répertoire contenant '.git' (répertoire ou fichier de worktree), sans lancer git
+        resolved_path = Path(path).resolve()
+        for directory in (resolved_path, *resolved_path.parents):
+            if (directory / '.git').exists():
+                return str(directory)
+        return None
 
     def __new__(cls):
-        if cls.singleton_instance is None:
-            cls.singleton_instance = super(Parameters, cls).__new__(cls)
-            current_directory = os.getcwd()
-            cls.script_path: str = str(cls.find_git_root_directory(current_directory))
-            parsed_args = Parameters.get_instance().parse_command_line_arguments()
-            file, extension = os.path.splitext(parsed_args.configuration)
-            if parsed_args.runtime in ['release', 'debug']:
-                if os.path.exists(f'{file}-{parsed_args.runtime}{extension}'):
-                    configuration_file = f'{file}-{parsed_args.runtime}{extension}'
-                else:
-                    configuration_file = f'{file}{extension}'
+        if cls.singleton_instance is not None:
+            return cls.singleton_instance  # Instance déjà initialisée : aucun travail supplémentaire
+        cls.singleton_instance = super(Parameters, cls).__new__(cls)
+        current_directory = os.getcwd()
+        cls.script_path: str = str(cls.find_git_root_directory(current_directory))
+        parsed_args = cls.parse_command_line_arguments()
+        file, extension = os.path.splitext(parsed_args.configuration)
+        if parsed_args.runtime in ['release', 'debug']:
+            if os.path.exists(f'{file}-{parsed_args.runtime}{extension}'):
+                configuration_file = f'{file}-{parsed_args.runtime}{extension}'
             else:
                 configuration_file = f'{file}{extension}'
-            log_path = os.path.join(parsed_args.logs, 'Python.Rsi.Bot')
-            os.makedirs(log_path, exist_ok=True)
+        else:
+            configuration_file = f'{file}{extension}'
+        log_path = os.path.join(parsed_args.logs, 'Python.Rsi.Bot')
+        os.makedirs(log_path, exist_ok=True)
 
-            cls.parsed_args = parsed_args
-            cls.configuration_path = os.path.join(cls.script_path, configuration_file)
-            cls.log_file = cls.update_file_path_with_extension(cls.configuration_path, log_path, '.log')
-            cls.database = cls.update_file_path_with_extension(cls.configuration_path, log_path, '.db')
+        cls.parsed_args = parsed_args
+        cls.configuration_path = os.path.join(cls.script_path, configuration_file)
+        cls.log_file = cls.update_file_path_with_extension(cls.configuration_path, log_path, '.log')
+        cls.database = cls.update_file_path_with_extension(cls.configuration_path, log_path, '.db')
 
-            yaml.add_constructor('!include', cls.handle_yaml_file_inclusion, Loader=yaml.FullLoader)
+        ConfigurationYamlLoader.add_constructor('!include', cls.handle_yaml_file_inclusion)
+        cls.configuration_cache_path = cls.update_file_path_with_extension(cls.configuration_path, log_path, '.cache.json')
+        cached_configurations = cls.load_configuration_cache(cls.configuration_cache_path, cls.configuration_path)
+        if cached_configurations is not None:
+            cached_yaml, target_tokens_configuration, cached_tokens_path = cached_configurations
+            target_tokens_yaml: str | bytes = os.path.join(cls.script_path, cached_yaml['bot']['pairs']['file'])
+            if os.path.abspath(target_tokens_yaml) != cached_tokens_path:
+                cached_configurations = None  # Cache écrit pour un autre fichier de tokens (autre racine de dépôt)
+            else:
+                cls.yaml = cached_yaml
+        if cached_configurations is None:
+            cls.included_files = []
             cls.yaml = cls.load_configuration_from_file(cls.configuration_path)
             target_tokens_yaml: str | bytes = os.path.join(cls.script_path, cls.yaml['bot']['pairs']['file'])
             target_tokens_configuration = cls.load_configuration_from_file(target_tokens_yaml)
-            cls.target_tokens_yaml = target_tokens_yaml
-            cls.forbidden = target_tokens_configuration['forbidden']
-            cls.port = parsed_args.port
+            cls.store_configuration_cache(cls.configuration_cache_path, cls.configuration_path, target_tokens_yaml,
+                                          cls.included_files, cls.yaml, target_tokens_configuration)
+        cls.target_tokens_yaml = target_tokens_yaml
+        cls.forbidden = target_tokens_configuration['forbidden']
+        cls.port = parsed_args.port
         return cls.singleton_instance
 
     @staticmethod
@@ -137,6 +167,9 @@ class Parameters:
         """
         Gestion des inclusions de fichiers YAML.
 
+        Un fichier inclus plusieurs fois n'est analysé qu'une fois tant qu'il n'est pas modifié : les inclusions
+        suivantes partagent le même objet, comme les alias YAML.
+
         Args:
             loader (Loader): Le chargeur YAML utilisé pour lire les fichiers.
             node (Node): Le nœud YAML qui contient le chemin du fichier à inclure.
@@ -144,9 +177,14 @@ class Parameters:
         Returns:
             dict: Les données chargées à partir du fichier inclus.
         """
-        file_name = os.path.join(os.path.dirname(loader.name), node.value)
-        with open(file_name, 'r') as f:
-            return yaml.load(f, Loader=yaml.FullLoader)
+        # Le nom du fichier courant est porté par la position du nœud (l'analyseur C n'expose pas loader.name)
+        file_name = os.path.join(os.path.dirname(node.start_mark.name), node.value)
+        cls.included_files.append(file_name)  # Fichier source à surveiller pour invalider le cache
+        inclusion_key = (os.path.abspath(file_name), os.stat(file_name).st_mtime_ns)
+        if inclusion_key not in cls.included_configurations:
+            with open(file_name, 'rb') as f:
+                cls.included_configurations[inclusion_key] = yaml.load(f, Loader=ConfigurationYamlLoader)
+        return cls.included_configurations[inclusion_key]
 
     @classmethod
     def load_configuration_from_file(cls, file_name):
@@ -159,5 +197,99 @@ class Parameters:
         Returns:
             dict: Le contenu du fichier de configuration.
         """
-        with open(file_name, 'r') as f:
-            return yaml.load(f, Loader=yaml.FullLoader)
+        with open(file_name, 'rb') as f:
+            return yaml.load(f, Loader=ConfigurationYamlLoader)
+
+    @staticmethod
+    def read_modification_times(file_names):
+        """
+        Lit les horodatages de modification des fichiers sources de la configuration.
+
+        Args:
+            file_names (list[str]): Les chemins des fichiers sources.
+
+        Returns:
+            dict or None: Horodatage en nanosecondes par chemin, ou None si un fichier est absent.
+        """
+        try:
+            return {file_name: os.stat(file_name).st_mtime_ns for file_name in file_names}
+        except OSError:
+            return None
+
+    @classmethod
+    def load_configuration_cache(cls, cache_path, configuration_path):
+        """
+        Charge les configurations analysées depuis le cache disque, s'il est à jour.
+
+        Le cache est un document JSON : sa lecture n'exécute aucun code, même si le répertoire des logs est modifiable.
+        Il n'est retenu que s'il a été écrit pour le même fichier de configuration (chemin absolu), le répertoire des
+        logs pouvant être partagé par plusieurs dépôts ou configurations de même nom.
+
+        Args:
+            cache_path (str): Le chemin du fichier de cache.
+            configuration_path (str): Le chemin du fichier de configuration principal.
+
+        Returns:
+            tuple or None: La configuration principale, celle des tokens et le chemin absolu du fichier des tokens,
+            ou None si le cache est absent, invalide, périmé ou écrit pour une autre configuration.
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Un cache de forme inattendue est ignoré plutôt que de bloquer le démarrage
+        if not isinstance(cache, dict) or not all(isinstance(cache.get(key), dict) for key in ('modification_times', 'configuration', 'tokens')):
+            return None
+        if not all(isinstance(cache.get(key), str) for key in ('configuration_path', 'tokens_path')):
+            return None
+        if cache['configuration_path'] != os.path.abspath(configuration_path):
+            return None
+        modification_times = cache['modification_times']
+        if not all(isinstance(file_name, str) and type(modification_time) is int for file_name, modification_time in modification_times.items()):
+            return None
+        # Le cache n'est valide que si aucun fichier source (y compris les inclusions) n'a été modifié
+        if cls.read_modification_times(modification_times) != modification_times:
+            return None
+        return cache['configuration'], cache['tokens'], cache['tokens_path']
+
+    @classmethod
+    def store_configuration_cache(cls, cache_path, configuration_path, tokens_path, included_files, configuration,
+                                  tokens_configuration):
+        """
+        Enregistre les configurations analysées dans le cache disque, avec les horodatages de leurs fichiers sources.
+
+        Une configuration que JSON ne restitue pas à l'identique (dates, clés non textuelles...) n'est pas mise en cache.
+
+        Args:
+            cache_path (str): Le chemin du fichier de cache.
+            configuration_path (str): Le chemin du fichier de configuration principal.
+            tokens_path (str): Le chemin du fichier de configuration des tokens.
+            included_files (list[str]): Les chemins des fichiers inclus par la configuration.
+            configuration (dict): La configuration principale.
+            tokens_configuration (dict): La configuration des tokens.
+        """
+        file_names = [os.path.abspath(file_name) for file_name in [configuration_path, tokens_path, *included_files]]
+        modification_times = cls.read_modification_times(file_names)
+        if modification_times is None:
+            return
+        cache = {'configuration_path': file_names[0], 'tokens_path': file_names[1], 'modification_times': modification_times,
+                 'configuration': configuration, 'tokens': tokens_configuration}
+        try:
+            payload = json.dumps(cache)
+        except (TypeError, ValueError):
+            return
+        if json.loads(payload) != cache:
+            return
+        temporary_path = f'{cache_path}.tmp'
+        try:
+            # Écriture atomique : un cache partiellement écrit n'est jamais relu
+            with open(temporary_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            # Le cache est une optimisation : son échec ne bloque pas le démarrage, le fichier temporaire est retiré
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
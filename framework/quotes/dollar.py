@@ -9,6 +9,8 @@ class USDT(Quote):
     tout en fournissant une représentation spécifique pour la devise USDT.
     """
 
+    __slots__ = ()  # Attributs fixes : pas de __dict__ par instance
+
     def __str__(self):
         """
         Retourne une représentation en chaîne de caractères de la quote en USDT.
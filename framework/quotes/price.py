@@ -6,6 +6,8 @@ class Price:
     telles que la soustraction et la multiplication, et comparer différents prix.
     """
 
+    __slots__ = ('price', 'quote')  # Attributs fixes : pas de __dict__ par instance
+
     # Constante ZERO représentant un prix de 0.0 avec une devise nulle
     ZERO = None
 
@@ -72,22 +74,24 @@ class Price:
 
     def __mul__(self, other):
         """
-        Permet la multiplication de Price par un nombre flottant (float).
+        Permet la multiplication de Price par un nombre (float ou int).
 
         Paramètres :
-        other (float) : Un nombre flottant pour multiplier le prix.
+        other (float | int) : Un nombre pour multiplier le prix.
 
         Retourne :
-        Price : Une nouvelle instance de Price avec le montant ajusté.
+        Price : Une nouvelle instance de Price avec le montant multiplié.
 
         Lève :
-        TypeError : Si l'objet other n'est pas de type float.
+        TypeError : Si l'objet other n'est pas un nombre (via NotImplemented).
         """
-        if not isinstance(other, float):
-            raise TypeError('Price ne peut être multiplié qu\'avec un objet de type float')
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+
+        return Price(self.price * other, self.quote)
 
-        price = self.price * other
-        return Price(price=price, quote=self.quote)
+    # La multiplication est commutative : 2.0 * price équivaut à price * 2.0
+    __rmul__ = __mul__
 
     def __eq__(self, other):
         """
@@ -103,18 +107,6 @@ class Price:
             return NotImplemented
         return self.price == other.price
 
-    def __ne__(self, other):
-        """
-        Vérifie si deux instances de Price ne sont pas égales.
-
-        Paramètres :
-        other (Price) : Une autre instance de Price à comparer.
-
-        Retourne :
-        bool : True si les montants de prix sont différents, False sinon.
-        """
-        return not self.__eq__(other)
-
     def __lt__(self, other):
         """
         Vérifie si une instance de Price est inférieure à une autre.
@@ -139,7 +131,9 @@ class Price:
         Retourne :
         bool : True si le montant du prix est inférieur ou égal, False sinon.
         """
-        return self.__lt__(other) or self.__eq__(other)
+        if not isinstance(other, Price):
+            return NotImplemented
+        return self.price <= other.price  # Une seule comparaison, sans appels à __lt__/__gt__ et __eq__
 
     def __gt__(self, other):
         """
@@ -165,7 +159,9 @@ class Price:
         Retourne :
         bool : True si le montant du prix est supérieur ou égal, False sinon.
         """
-        return self.__gt__(other) or self.__eq__(other)
+        if not isinstance(other, Price):
+            return NotImplemented
+        return self.price >= other.price  # Une seule comparaison, sans appels à __lt__/__gt__ et __eq__
 
 
 # Initialise la constante ZERO avec une instance de Price de montant 0.0 et sans devise
@@ -1,8 +1,8 @@
-import decimal
 from typing import Optional
 
 from framework.business.bot_currency_pair import BotCurrencyPair
 from framework.quotes.price import Price
+from framework.quotes.quote import truncate_amount
 from framework.quotes.quotes_utils import create_currency_quote
 
 
@@ -14,6 +14,8 @@ class Quantity:
     arithmétiques telles que la multiplication avec des objets de type Price.
     """
 
+    __slots__ = ('quantity', 'currency_pair')  # Attributs fixes : pas de __dict__ par instance
+
     # Constante ZERO représentant une quantité nulle
     ZERO = None
 
@@ -65,15 +67,8 @@ class Quantity:
         Retourne :
         Quantity : Une nouvelle instance de Quantity avec la quantité ajustée à la précision spécifiée.
         """
-        # Convertit la quantité en Decimal pour un contrôle précis de la précision
-        amount = decimal.Decimal(self.quantity)
-
-        # Arrondit la quantité à la précision spécifiée
-        rounded_amount = amount.quantize(decimal.Decimal('1.' + '0' * pair_precision),
-                                         rounding=decimal.ROUND_DOWN)
-
-        # Retourne une nouvelle instance de Quantity avec la quantité ajustée
-        return Quantity(currency_pair=self.currency_pair, quantity=float(rounded_amount))
+        # Retourne une nouvelle instance de Quantity avec la quantité tronquée à la précision spécifiée
+        return Quantity(currency_pair=self.currency_pair, quantity=truncate_amount(self.quantity, pair_precision))
 
     def __str__(self):
         """
@@ -101,18 +96,6 @@ class Quantity:
             return NotImplemented
         return self.quantity == other.quantity
 
-    def __ne__(self, other):
-        """
-        Vérifie si deux instances de Quantity ne sont pas égales.
-
-        Paramètres :
-        other (Quantity) : Une autre instance de Quantity à comparer.
-
-        Retourne :
-        bool : True si les quantités sont différentes, False sinon.
-        """
-        return not self.__eq__(other)
-
     def __lt__(self, other):
         """
         Vérifie si une instance de Quantity est inférieure à une autre.
@@ -137,7 +120,9 @@ class Quantity:
         Retourne :
         bool : True si la quantité est inférieure ou égale, False sinon.
         """
-        return self.__lt__(other) or self.__eq__(other)
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return self.quantity <= other.quantity  # Une seule comparaison, sans appels à __lt__/__gt__ et __eq__
 
     def __gt__(self, other):
         """
@@ -163,7 +148,9 @@ class Quantity:
         Retourne :
         bool : True si la quantité est supérieure ou égale, False sinon.
         """
-        return self.__gt__(other) or self.__eq__(other)
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return self.quantity >= other.quantity  # Une seule comparaison, sans appels à __lt__/__gt__ et __eq__
 
 
 # Initialise la constante ZERO avec une instance de Quantity de montant 0.0
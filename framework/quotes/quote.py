@@ -1,6 +1,34 @@
-import decimal
+import math
 from abc import abstractmethod
 
+# Puissances de dix précalculées pour les précisions usuelles des paires
+powers_of_ten = tuple(10 ** exponent for exponent in range(19))
+
+
+def truncate_amount(amount: float, pair_precision: int) -> float:
+    """
+    Tronque un montant vers zéro (équivalent de ROUND_DOWN) à la précision spécifiée, sans objet Decimal ni chaîne.
+
+    La troncature porte sur la valeur binaire exacte du montant, comme Decimal(amount).quantize(..., ROUND_DOWN) :
+    0.29 vaut en réalité 0.28999999999999998..., et donne donc 0.28 à deux décimales.
+
+    Paramètres :
+    amount (float) : Le montant à tronquer.
+    pair_precision (int) : Le nombre de décimales à conserver.
+
+    Retourne :
+    float : Le montant tronqué, jamais supérieur en valeur absolue au montant initial. Un montant non fini (NaN,
+    infini) est retourné inchangé.
+    """
+    if not math.isfinite(amount):
+        # Ces montants n'ont pas de fraction exacte : ils n'ont pas de décimales à tronquer
+        return amount
+    factor = powers_of_ten[pair_precision] if pair_precision < len(powers_of_ten) else 10 ** pair_precision
+    # Fraction exacte du flottant : la division entière tronque sans erreur d'arrondi intermédiaire
+    numerator, denominator = amount.as_integer_ratio()
+    scaled_amount = abs(numerator) * factor // denominator
+    # La division entre entiers est correctement arrondie : le résultat est le flottant le plus proche, comme float(Decimal)
+    return math.copysign(scaled_amount / factor, amount)
 
 class Quote:
     """
@@ -9,6 +37,8 @@ class Quote:
     la gestion de la précision, et la comparaison avec d'autres instances de Quote.
     """
 
+    __slots__ = ('amount',)  # Attributs fixes : pas de __dict__ par instance
+
     # Constante ZERO représentant une quote de montant 0
     ZERO = None
 
@@ -64,12 +94,7 @@ class Quote:
         Retourne :
         Quote : Une nouvelle instance de Quote avec le montant ajusté à la précision spécifiée.
         """
-        # Convertit le montant en Decimal pour un contrôle précis de la précision
-        amount = decimal.Decimal(self.amount)
-        # Arrondit le montant à la précision spécifiée
-        rounded_amount = amount.quantize(decimal.Decimal('1.' + '0' * pair_precision),
-                                         rounding=decimal.ROUND_DOWN)
-        return Quote(float(rounded_amount))
+        return Quote(truncate_amount(self.amount, pair_precision))
 
     @abstractmethod
     def __str__(self):
@@ -95,18 +120,6 @@ class Quote:
             return NotImplemented
         return self.amount == other.amount
 
-    def __ne__(self, other):
-        """
-        Vérifie si deux instances de Quote ne sont pas égales.
-
-        Paramètres :
-        other (Quote) : Une autre instance de Quote à comparer.
-
-        Retourne :
-        bool : True si les montants sont différents, False sinon.
-        """
-        return not self.__eq__(other)
-
     def __lt__(self, other):
         """
         Vérifie si une instance de Quote est inférieure à une autre.
@@ -131,7 +144,9 @@ class Quote:
         Retourne :
         bool : True si le montant est inférieur ou égal, False sinon.
         """
-        return self.__lt__(other) or self.__eq__(other)
+        if not isinstance(other, Quote):
+            return NotImplemented
+        return self.amount <= other.amount  # Une seule comparaison, sans appels à __lt__/__gt__ et __eq__
 
     def __gt__(self, other):
         """
@@ -157,7 +172,9 @@ class Quote:
         Retourne :
         bool : True si le montant est supérieur ou égal, False sinon.
         """
-        return self.__gt__(other) or self.__eq__(other)
+        if not isinstance(other, Quote):
+            return NotImplemented
+        return self.amount >= other.amount  # Une seule comparaison, sans appels à __lt__/__gt__ et __eq__
 
 
 # Initialise la constante ZERO avec une instance de Quote de montant 0.0
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Optional
 
 from framework.business.bot_currency_pair import BotCurrencyPair
@@ -6,7 +7,14 @@ from framework.parameters.parameters import Parameters
 from framework.quotes.bitoin import BTC
 from framework.quotes.dollar import USDT
 
+# Table de traduction normalisant les séparateurs '/' et '-' en '_' en une seule passe
+pair_separators_translation = str.maketrans('/-', '__')
 
+# Classes de devises de cotation prises en charge, par symbole
+quote_currency_classes = {'USDT': USDT, 'BTC': BTC}
+
+
+@lru_cache(maxsize=4096)
 def base_from_pair(pair: str):
     """
     Extrait la devise de base à partir d'une paire de devises.
@@ -17,11 +25,10 @@ def base_from_pair(pair: str):
     Retourne :
     str : La devise de base (par exemple, 'BTC').
     """
-    parts = pair.split('_')  # Sépare la paire de devises en utilisant '_' comme séparateur
-    base = parts[0]  # La première partie est la devise de base
-    return base
+    return pair.partition('_')[0]  # La partie précédant le premier '_' est la devise de base
 
 
+@lru_cache(maxsize=4096)
 def quote_from_pair(pair: str, default='USDT'):
     """
     Extrait la devise de cotation (quote) à partir d'une paire de devises, ou retourne une devise par défaut.
@@ -33,10 +40,8 @@ def quote_from_pair(pair: str, default='USDT'):
     Retourne :
     str : La devise de cotation (quote) ou la devise par défaut.
     """
-    parts = pair.split('_')  # Sépare la paire de devises en utilisant '_' comme séparateur
-    if len(parts) == 2:  # Vérifie si la paire contient une devise de cotation
-        quote = parts[1]  # La deuxième partie est la devise de cotation
-    else:
+    _, separator, quote = pair.partition('_')  # Sépare la paire au premier '_' sans construire de liste
+    if not separator or '_' in quote:  # La paire doit contenir exactement une devise de base et une devise de cotation
         quote = default  # Utilise la devise par défaut si aucune devise de cotation n'est trouvée
     return quote
 
@@ -55,14 +60,13 @@ def create_currency_quote(amount, quote):
     Lève :
     ValueError : Si la devise de cotation n'est pas prise en charge.
     """
-    if quote == 'USDT':
-        return USDT(amount)  # Retourne une instance de la classe USDT avec le montant spécifié
-    elif quote == 'BTC':
-        return BTC(amount)  # Retourne une instance de la classe BTC avec le montant spécifié
-    else:
+    quote_class = quote_currency_classes.get(quote)  # Une seule recherche dans la table des devises prises en charge
+    if quote_class is None:
         raise ValueError('Unsupported quote currency')  # Lève une erreur si la devise de cotation n'est pas supportée
+    return quote_class(amount)  # Retourne une instance de la classe de devise avec le montant spécifié
 
 
+@lru_cache(maxsize=4096)
 def quote_currency(currency_pair):
     """
     Extrait la devise de cotation (quote) à partir d'une paire de devises en remplaçant certains séparateurs.
@@ -73,7 +77,7 @@ def quote_currency(currency_pair):
     Retourne :
     str : La devise de cotation (quote) en majuscules.
     """
-    quote = currency_pair.replace('/', '_').replace('-', '_').split('_')[-1]  # Remplace '/' et '-' par '_' et extrait la dernière partie
+    quote = currency_pair.translate(pair_separators_translation).rpartition('_')[2]  # Normalise les séparateurs et extrait la dernière partie
     return quote.upper()  # Retourne la devise de cotation en majuscules
 
 
@@ -94,8 +98,8 @@ def gateio_currency_pair(pair_symbol: str, keep_pair_quote: bool, trading_quote)
         Optional[BotCurrencyPair]: Un objet BotCurrencyPair ou None si la base et la quote sont identiques.
     """
 
-    # Normalise la paire de devises en remplaçant les '/' et '-' par des '_' et en mettant en majuscule
-    symbol = pair_symbol.replace('/', '_').replace('-', '_').upper()
+    # Normalise la paire de devises en remplaçant les '/' et '-' par des '_' (une seule passe) et en mettant en majuscule
+    symbol = pair_symbol.translate(pair_separators_translation).upper()
     parts = symbol.split('_')  # Sépare la paire de devises en base et quote
     base = parts[0]  # Devise de base de la paire
     quote = trading_quote  # Initialisation de la devise de cotation avec la valeur par défaut
@@ -22,10 +22,15 @@ class BotThreadPoolExecutor:
     singleton_instance = None  # Variable de classe pour stocker l'instance unique
     instance_creation_lock = threading.Lock()  # Verrou pour assurer une création d'instance thread-safe
 
-    def __new__(cls, *args, **kwargs):
+    def __new__(cls, max_workers=None):
         """
         Méthode spéciale __new__ pour créer une instance de la classe. Elle garantit que seule une instance
-        de BotThreadPoolExecutor est créée (implémentation du singleton).
+        de BotThreadPoolExecutor est créée (implémentation du singleton) et initialise son ThreadPoolExecutor
+        une seule fois, à la création : les appels suivants retournent directement l'instance existante.
+
+        Paramètres :
+        max_workers (int, optionnel) : Le nombre maximum de threads à utiliser dans le pool (pris en compte
+        uniquement lors de la création de l'instance).
 
         Retourne :
         instance (BotThreadPoolExecutor) : L'instance unique de la classe.
@@ -33,21 +38,12 @@ class BotThreadPoolExecutor:
         if not cls.singleton_instance:
             with cls.instance_creation_lock:  # Assure que la création de l'instance est thread-safe
                 if not cls.singleton_instance:  # Double vérification pour s'assurer qu'aucune autre instance n'a été créée
-                    cls.singleton_instance = super(BotThreadPoolExecutor, cls).__new__(cls)
+                    instance = super(BotThreadPoolExecutor, cls).__new__(cls)
+                    # Initialise un ThreadPoolExecutor avec le nombre maximum de threads spécifié
+                    instance.executor = ThreadPoolExecutor(max_workers=max_workers)
+                    cls.singleton_instance = instance  # Publiée seulement une fois entièrement initialisée
         return cls.singleton_instance
 
-    def __init__(self, max_workers=None):
-        """
-        Initialise l'instance de BotThreadPoolExecutor. Si l'instance est déjà initialisée,
-        elle ne refait pas l'initialisation pour éviter de recréer le ThreadPoolExecutor.
-
-        Paramètres :
-        max_workers (int, optionnel) : Le nombre maximum de threads à utiliser dans le pool.
-        """
-        if not hasattr(self, 'executor'):
-            # Initialise un ThreadPoolExecutor avec le nombre maximum de threads spécifié
-            self.executor = ThreadPoolExecutor(max_workers=max_workers)
-
     def submit_task(self, func, *args, **kwargs):
         """
         Soumet une fonction à exécuter dans le pool de threads.
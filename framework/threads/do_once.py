@@ -1,9 +1,30 @@
+import threading
 from functools import wraps
 
+# Verrou partagé par les méthodes décorées : il n'est acquis que jusqu'au premier appel de chaque méthode
+do_once_lock = threading.Lock()
+
+
+def do_nothing(*args, **kwargs):
+    """
+    Fonction vide substituée aux fonctions et méthodes déjà exécutées.
+
+    Paramètres :
+    *args : Arguments positionnels ignorés.
+    **kwargs : Arguments nommés ignorés.
+
+    Retourne :
+    None
+    """
+    return None
+
 
 class DoOnce:
     """
     Classe DoOnce utilisée comme un décorateur pour exécuter une fonction ou une méthode une seule fois.
+
+    Le premier appel est protégé par un verrou : deux threads ne peuvent pas exécuter la fonction simultanément.
+    L'instance devient ensuite un ConsumedDoOnce, dont l'appel ne fait plus rien, sans verrou ni test.
     """
 
     def __init__(self, func):
@@ -15,6 +36,7 @@ class DoOnce:
         """
         self.func = func  # La fonction qui sera décorée
         self.has_run = False  # Indicateur pour vérifier si la fonction a déjà été exécutée
+        self.execution_lock = threading.Lock()  # Verrou protégeant le premier appel
 
     def __call__(self, *args, **kwargs):
         """
@@ -27,15 +49,29 @@ class DoOnce:
         Retourne :
         Le résultat de la fonction si elle est exécutée, sinon None.
         """
-        if not self.has_run:
+        with self.execution_lock:
+            if self.has_run:
+                return None
             self.has_run = True  # Marque la fonction comme exécutée
-            return self.func(*args, **kwargs)  # Appelle la fonction décorée
+            self.__class__ = ConsumedDoOnce  # Les appels suivants ne passent plus par ce test
+        return self.func(*args, **kwargs)  # Appelle la fonction décorée
+
+
+class ConsumedDoOnce(DoOnce):
+    """
+    Classe ConsumedDoOnce prise par une instance de DoOnce après son premier appel.
+    """
+
+    __call__ = do_nothing
 
 
 def do_once_decorator(method):
     """
     Décorateur de méthode pour assurer que la méthode est exécutée une seule fois par instance de classe.
 
+    Après le premier appel, la méthode est masquée sur l'instance par une fonction vide : les appels suivants
+    ne passent plus par le wrapper.
+
     Paramètres :
     method (callable) : La méthode à exécuter une seule fois.
 
@@ -45,13 +81,16 @@ def do_once_decorator(method):
 
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        # Initialise un attribut _do_once_flag pour l'instance si non présent
-        if not hasattr(self, '_do_once_flag'):
-            self._do_once_flag = {}
+        with do_once_lock:  # Empêche deux threads d'exécuter la méthode lors du premier appel
+            # Initialise un attribut _do_once_flag pour l'instance si non présent
+            if not hasattr(self, '_do_once_flag'):
+                self._do_once_flag = {}
 
-        # Vérifie si la méthode a déjà été exécutée
-        if method.__name__ not in self._do_once_flag:
+            # Vérifie si la méthode a déjà été exécutée (appel via une référence obtenue avant le premier appel)
+            if method.__name__ in self._do_once_flag:
+                return None
             self._do_once_flag[method.__name__] = True  # Marque la méthode comme exécutée
-            return method(self, *args, **kwargs)  # Appelle la méthode
+            setattr(self, method.__name__, do_nothing)  # Masque la méthode de classe pour les appels suivants
+        return method(self, *args, **kwargs)  # Appelle la méthode
 
     return wrapper
@@ -0,0 +1,110 @@
+import os
+import threading
+from typing import Callable, Iterable
+
+
+class FileReloader:
+    """
+    Classe FileReloader déclenchant un rechargement uniquement lorsque les fichiers surveillés changent.
+
+    Les horodatages des fichiers sont scrutés à intervalle régulier : tant qu'aucun fichier n'est modifié, seuls des
+    appels à stat() sont effectués, sans relire ni analyser les fichiers.
+    """
+
+    def __init__(self, paths_provider: Callable[[], Iterable[str]], reload_callback: Callable[[], object], poll_interval: float = 5.0):
+        """
+        Paramètres :
+        paths_provider (callable) : Fonction retournant les chemins des fichiers à surveiller.
+        reload_callback (callable) : Fonction appelée lorsqu'un fichier surveillé a été modifié.
+        poll_interval (float) : Intervalle de scrutation en secondes.
+        """
+        self.paths_provider = paths_provider
+        self.reload_callback = reload_callback
+        self.poll_interval = poll_interval
+        self.stop_event = threading.Event()
+        self.watched_paths: set[str] = set()
+        self.modification_times: dict[str, int] = {}
+        self.worker_thread = None
+
+    def start(self):
+        """
+        Démarre la surveillance des fichiers et le thread de rechargement.
+
+        Retourne :
+        FileReloader : L'instance elle-même.
+        """
+        self.watched_paths = {os.path.abspath(path) for path in self.paths_provider()}
+        self.modification_times = self.read_modification_times(self.watched_paths)
+        self.worker_thread = threading.Thread(target=self.run, name='FileReloader', daemon=True)
+        self.worker_thread.start()
+        return self
+
+    def stop(self):
+        """
+        Arrête la surveillance et attend la fin du thread de rechargement.
+        """
+        self.stop_event.set()  # Réveille le thread en attente
+        if self.worker_thread is not None:
+            self.worker_thread.join()
+
+    def update_watched_paths(self):
+        """
+        Ajoute les fichiers apparus dans la liste à surveiller (par exemple après le rechargement de la configuration).
+
+        Seuls les horodatages des nouveaux fichiers sont lus : ceux des fichiers déjà surveillés restent ceux relevés
+        avant le rechargement, de sorte qu'une modification survenue pendant le rechargement est détectée ensuite.
+        L'ajout d'un fichier ne déclenche donc pas, à lui seul, de rechargement.
+        """
+        new_paths = {os.path.abspath(path) for path in self.paths_provider()} - self.watched_paths
+        if not new_paths:
+            return
+        self.watched_paths.update(new_paths)
+        self.modification_times.update(self.read_modification_times(new_paths))
+
+    @staticmethod
+    def read_modification_times(paths: Iterable[str]) -> dict[str, int]:
+        """
+        Retourne les horodatages de modification (en nanosecondes) des fichiers indiqués.
+
+        Paramètres :
+        paths (Iterable[str]) : Chemins des fichiers.
+
+        Retourne :
+        dict[str, int] : Horodatage par chemin, 0 si le fichier est absent.
+        """
+        modification_times = {}
+        for path in paths:
+            try:
+                modification_times[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                modification_times[path] = 0
+        return modification_times
+
+    def poll_for_changes(self) -> bool:
+        """
+        Relève les horodatages des fichiers surveillés et indique si l'un d'eux a évolué depuis le dernier relevé.
+
+        Retourne :
+        bool : True si un fichier surveillé a été modifié, ajouté ou supprimé.
+        """
+        modification_times = self.read_modification_times(self.watched_paths)
+        if modification_times == self.modification_times:
+            return False
+        self.modification_times = modification_times  # Relevé antérieur au rechargement
+        return True
+
+    def run(self):
+        """
+        Boucle du thread de rechargement : scrute les fichiers puis appelle la fonction de rechargement si besoin.
+        """
+        while not self.stop_event.wait(self.poll_interval):
+            if not self.poll_for_changes():
+                continue
+            try:
+                self.reload_callback()
+            except Exception as exception:
+                # Import différé : logs_utils charge la configuration du bot dès son import
+                from framework.logs.logs_utils import logger
+                logger.error(f'File reload failed: {exception}')
+            # La liste des fichiers surveillés peut avoir évolué avec la configuration rechargée
+            self.update_watched_paths()
@@ -1,17 +1,15 @@
-import threading
-
-
 class ThreadSafeDict:
     """
     Classe ThreadSafeDict fournissant un dictionnaire sécurisé pour les threads.
 
-    Cette classe utilise un verrou (`Lock`) pour assurer que toutes les opérations de lecture et d'écriture
-    sur le dictionnaire sont thread-safe.
+    Chaque méthode se ramène à une seule opération native du dictionnaire (affectation, `get`, `pop`, `copy`).
+    Sous CPython, ces opérations sont atomiques grâce au GIL tant que le hachage et la comparaison des clés ne
+    réexécutent pas de code Python (chaînes, entiers, tuples) : aucun verrou n'est donc nécessaire et les
+    threads lecteurs ne se bloquent plus mutuellement.
 
     ### Correspondance des noms (Ancien → Nouveau → Signification)
     | Ancien Nom      | Nouveau Nom                | Signification                                                   |
     |-----------------|----------------------------|-----------------------------------------------------------------|
-    | `self.lock`     | `thread_safety_lock`       | Verrou pour synchroniser l'accès au dictionnaire                |
     | `self.dict`     | `thread_safe_dictionary`   | Dictionnaire interne utilisé pour stocker les données           |
     | `set`           | `add_or_update_entry`      | Ajoute ou met à jour une entrée dans le dictionnaire            |
     | `get`           | `retrieve_entry`           | Récupère une valeur associée à une clé                          |
@@ -23,9 +21,8 @@ class ThreadSafeDict:
 
     def __init__(self):
         """
-        Initialise une instance de ThreadSafeDict avec un dictionnaire vide et un verrou pour assurer la sécurité des threads.
+        Initialise une instance de ThreadSafeDict avec un dictionnaire vide.
         """
-        self.thread_safety_lock = threading.Lock()  # Verrou pour synchroniser l'accès au dictionnaire
         self.thread_safe_dictionary = {}  # Dictionnaire interne pour stocker les données
 
     def add_or_update_entry(self, key, value):
@@ -36,8 +33,7 @@ class ThreadSafeDict:
         key : La clé à ajouter ou mettre à jour dans le dictionnaire.
         value : La valeur associée à la clé.
         """
-        with self.thread_safety_lock:  # Acquiert le verrou avant d'accéder au dictionnaire
-            self.thread_safe_dictionary[key] = value  # Met à jour la valeur associée à la clé
+        self.thread_safe_dictionary[key] = value  # Affectation atomique sous le GIL
 
     def retrieve_entry(self, key):
         """
@@ -49,8 +45,7 @@ class ThreadSafeDict:
         Retourne :
         La valeur associée à la clé, ou None si la clé n'existe pas.
         """
-        with self.thread_safety_lock:  # Acquiert le verrou avant d'accéder au dictionnaire
-            return self.thread_safe_dictionary.get(key)  # Récupère la valeur associée à la clé
+        return self.thread_safe_dictionary.get(key)  # Lecture atomique sous le GIL
 
     def delete_entry(self, key):
         """
@@ -59,9 +54,7 @@ class ThreadSafeDict:
         Paramètres :
         key : La clé à supprimer du dictionnaire.
         """
-        with self.thread_safety_lock:  # Acquiert le verrou avant d'accéder au dictionnaire
-            if key in self.thread_safe_dictionary:  # Vérifie si la clé existe dans le dictionnaire
-                del self.thread_safe_dictionary[key]  # Supprime la clé et sa valeur associée
+        self.thread_safe_dictionary.pop(key, None)  # Une seule recherche, atomique sous le GIL
 
     def retrieve_all_keys(self):
         """
@@ -70,8 +63,7 @@ class ThreadSafeDict:
         Retourne :
         list : Une liste de toutes les clés du dictionnaire.
         """
-        with self.thread_safety_lock:  # Acquiert le verrou avant d'accéder au dictionnaire
-            return list(self.thread_safe_dictionary.keys())  # Retourne une liste des clés
+        return list(self.thread_safe_dictionary.copy())  # La copie atomique évite une itération concurrente
 
     def retrieve_all_items(self):
         """
@@ -80,8 +72,7 @@ class ThreadSafeDict:
         Retourne :
         list : Une liste de toutes les paires clé-valeur du dictionnaire.
         """
-        with self.thread_safety_lock:  # Acquiert le verrou avant d'accéder au dictionnaire
-            return list(self.thread_safe_dictionary.items())  # Retourne une liste des paires clé-valeur
+        return list(self.thread_safe_dictionary.copy().items())  # La copie atomique évite une itération concurrente
 
     def retrieve_copy_of_dict(self):
         """
@@ -90,5 +81,4 @@ class ThreadSafeDict:
         Retourne :
         dict : Une copie du dictionnaire interne.
         """
-        with self.thread_safety_lock:  # Acquiert le verrou avant d'accéder au dictionnaire
-            return dict(self.thread_safe_dictionary)  # Retourne une copie du dictionnaire
+        return self.thread_safe_dictionary.copy()  # Copie atomique sous le GIL
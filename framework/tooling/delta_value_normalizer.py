@@ -5,6 +5,23 @@ from framework.logs.logs_utils import logger
 from framework.tooling.timeframe_adjuster import TimeframeAdjuster
 
 
+def calculate_weighted_norm(matrix, weights):
+    """
+    Calcule, pour chaque ligne, la norme euclidienne des valeurs pondérées.
+
+    Args:
+        matrix (np.ndarray): Matrice float64 (lignes x colonnes) des valeurs à normaliser.
+        weights (np.ndarray): Poids float64 de chaque colonne.
+
+    Returns:
+        np.ndarray: La norme pondérée de chaque ligne.
+    """
+    weighted_values = matrix * weights  # Unique bloc temporaire, réutilisé en place pour les carrés
+    np.square(weighted_values, out=weighted_values)
+    norms = weighted_values.sum(axis=1)
+    return np.sqrt(norms, out=norms)
+
+
 class DeltaValueNormalizer:
     """
     Classe DeltaValueNormalizer pour normaliser les données basées sur un mapping de colonnes et des poids associés.
@@ -37,10 +54,18 @@ class DeltaValueNormalizer:
             normalized_column_name (str): Nom de la colonne où le résultat de la normalisation sera stocké.
             column_weight_mapping (dict): Stocke le mapping des colonnes aux poids.
             dataframe_adjuster (Adjuster): Stocke l'instance de Adjuster.
+            weighted_columns (list): Noms des colonnes pondérées, dans l'ordre des poids.
+            column_weights (np.ndarray): Poids float64 de chaque colonne pondérée.
+            possible_max (float): Norme pondérée maximale, atteinte lorsque toutes les colonnes valent 100.
         """
         self.normalized_column_name: str = 'normalized_column'
         self.column_weight_mapping: dict = column_weight_mapping
         self.dataframe_adjuster: TimeframeAdjuster = dataframe_adjuster
+        # Constantes de la normalisation, calculées une seule fois plutôt qu'à chaque DataFrame
+        self.weighted_columns: list = list(column_weight_mapping)
+        self.column_weights: np.ndarray = np.array([column_info['weight'] for column_info in column_weight_mapping.values()],
+                                                   dtype=np.float64)
+        self.possible_max: float = float(np.sqrt(np.square(100.0 * self.column_weights).sum()))
 
     def __calculate_weighted_norm(self, dataframe: DataFrame):
         """
@@ -50,15 +75,14 @@ class DeltaValueNormalizer:
             dataframe (DataFrame): DataFrame contenant les données à normaliser.
 
         Returns:
-            float: La valeur normalisée, pondérée par les poids des colonnes, arrondie à deux décimales.
+            np.ndarray: Les valeurs normalisées, pondérées par les poids des colonnes, arrondies à deux décimales.
         """
-        squares_sum = sum(pow(dataframe[column_name] * column_info['weight'], 2)
-                          for column_name, column_info in self.column_weight_mapping.items())
-        norm = np.sqrt(squares_sum)
-        possible_max = np.sqrt(sum(pow(100.0 * column_info['weight'], 2)
-                                   for column_info in self.column_weight_mapping.values()))
-        pct_norm = (norm / possible_max) * 100.0
-        return round(pct_norm, 2)
+        matrix = dataframe[self.weighted_columns].to_numpy(dtype=np.float64, copy=False)
+        norm = calculate_weighted_norm(matrix, self.column_weights)
+        # Opérations en place sur le vecteur des normes : aucune allocation supplémentaire
+        np.divide(norm, self.possible_max, out=norm)
+        np.multiply(norm, 100.0, out=norm)
+        return np.round(norm, 2, out=norm)
 
     def apply_normalization(self, delta_dataframes: dict):
         """
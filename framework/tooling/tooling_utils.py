@@ -5,6 +5,7 @@ import re
 import socket
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import numpy as np
@@ -59,7 +60,12 @@ def resolve_path_json_pairs(script_path, file_name):
         return file_name  # Retourne le chemin du fichier s'il existe déjà
 
 
+# Motif compilé une seule fois : paire de devises cotée en USDT
+usdt_pair_pattern = re.compile(r'^.*/USDT$')
+
+
 # noinspection PyUnusedLocal
+@lru_cache(maxsize=4096)
 def verify_pair(chaine):
     """
     Vérifie si une chaîne de caractères correspond à un motif de paire de devises avec 'USDT'.
@@ -70,8 +76,7 @@ def verify_pair(chaine):
     Retourne :
     bool : True si la chaîne correspond au motif, False sinon.
     """
-    motif = r'^.*/USDT$'
-    return bool(re.match(motif, chaine))  # Vérifie si la chaîne se termine par '/USDT'
+    return bool(usdt_pair_pattern.match(chaine))  # Vérifie si la chaîne se termine par '/USDT'
 
 
 def day_of_week():
@@ -156,6 +161,16 @@ def deserialize_class_reference(full_class_name):
     return getattr(module, class_name)
 
 
+# Conversions des scalaires NumPy vers les types natifs, résolues par une simple recherche sur le type exact
+json_type_converters = {
+    np.bool_: bool,
+    np.int32: int,
+    np.int64: int,
+    np.float32: float,
+    np.float64: float,
+}
+
+
 def default_converter(obj):
     """
     Convertit les types non sérialisables pour le JSON.
@@ -164,13 +179,14 @@ def default_converter(obj):
     obj : L'objet à convertir.
 
     Retourne :
-    bool : La valeur booléenne si l'objet est de type np.bool_.
+    bool | int | float : La valeur native correspondant au scalaire NumPy (np.bool_, np.int64, np.float32...).
 
     Lève :
     TypeError : Si l'objet n'est pas sérialisable en JSON.
     """
-    if isinstance(obj, np.bool_):
-        return bool(obj)
+    converter = json_type_converters.get(type(obj))
+    if converter is not None:
+        return converter(obj)
     raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
 
 
@@ -210,8 +226,13 @@ def list_diff(list_a: list, list_b: list) -> list:
     Retourne :
     list : Une liste contenant les éléments uniques à list_a.
     """
-    # Utiliser la compréhension de liste pour filtrer les éléments
-    return [item for item in list_a if item not in list_b]
+    # Utiliser la compréhension de liste pour filtrer les éléments, en conservant l'ordre et les doublons de list_a
+    try:
+        excluded_items = set(list_b)  # Test d'appartenance en O(1) : O(n + m) au lieu de O(n * m)
+        return [item for item in list_a if item not in excluded_items]
+    except TypeError:
+        # Éléments non hachables dans list_b ou list_a (levé par le test d'appartenance) : repli sur la recherche linéaire
+        return [item for item in list_a if item not in list_b]
 
 
 def file_exists(filepath: str, factor: int = 10) -> bool:
@@ -226,23 +247,17 @@ def file_exists(filepath: str, factor: int = 10) -> bool:
     Retourne :
     bool : True si le fichier existe et a été modifié il y a moins de '24 * facteur' heures, False sinon.
     """
-    output = False
+    try:
+        last_modified = os.stat(filepath).st_mtime  # Un seul appel système : existence et date de modification
+    except FileNotFoundError:
+        return False
 
-    if os.path.exists(filepath):  # Vérifie si le fichier existe
-        last_modified = os.path.getmtime(filepath)  # Obtient le temps de dernière modification du fichier
-        current_time = time.time()  # Obtient le temps actuel
-        time_difference = current_time - last_modified  # Calcule la différence de temps
+    if time.time() - last_modified < 86400 * factor:  # Vérifie si le fichier a été modifié dans la période limite (en secondes)
+        return True
 
-        # Convertit la différence de temps en heures
-        hours_difference = time_difference / 3600
-
-        if hours_difference < 24 * factor:  # Vérifie si le fichier a été modifié dans la période limite
-            output = True
-        else:
-            # Supprime le fichier s'il est plus vieux que la période limite
-            os.remove(filepath)
-
-    return output
+    # Supprime le fichier s'il est plus vieux que la période limite
+    os.unlink(filepath)
+    return False
 
 
 def round_up(value, decimals=4):
@@ -454,9 +469,10 @@ def seconds_to_timeframe(seconds: int) -> GateioTimeFrame:
     return GateioTimeFrame(output)
 
 
+@lru_cache(maxsize=32)
 def timeframe_to_seconds(timeframe: GateioTimeFrame) -> int:
     """
-    Convertit un timeframe en secondes.
+    Convertit un timeframe en secondes. Les timeframes formant un petit ensemble fixe, le résultat est mémorisé.
 
     Args:
         timeframe (GateioTimeFrame): Le timeframe à convertir (ex. '1h', '30m').
@@ -90,6 +90,37 @@ class TestFunctions(unittest.TestCase):
         self.assertGreater(normalized_volume, 0)  # Vérifie que le volume normalisé est supérieur à 0
         self.assertGreater(mean_volume, 0)  # Vérifie que le volume moyen filtré est supérieur à 0
 
+    def test_calculate_hourly_volume_matches_mask_filter(self):
+        # Référence : filtrage par masque sur un DataFrame filtré, comme l'implémentation d'origine
+        def reference_mean_volume(dataframe, tolerance):
+            current_rsi = dataframe['rsi'].iloc[-1]
+            mask = (dataframe['rsi'] >= current_rsi - tolerance) & (dataframe['rsi'] <= current_rsi + tolerance)
+            volumes = dataframe.loc[mask, 'volume'].dropna()
+            return volumes.mean() if len(volumes) else 0
+
+        random_generator = np.random.default_rng(0)
+        current_time = datetime.now()
+        timeframe = GateioTimeFrame('1h')
+        currency_pair = BotCurrencyPair('BTC/USDT')
+        index = [current_time - timedelta(hours=i) for i in range(99, 0, -1)] + [current_time - timedelta(minutes=50)]
+
+        for _ in range(20):
+            data = pd.DataFrame({
+                'volume': random_generator.uniform(100, 5000, 100),
+                'rsi': random_generator.uniform(20, 80, 100).round(0),
+            }, index=index)
+            data.iloc[random_generator.integers(0, 99, 5), 0] = np.nan
+            data.iloc[random_generator.integers(0, 99, 5), 1] = np.nan
+
+            # Même fenêtre de bougies, valeurs différentes à chaque itération
+            _, mean_volume = calculate_hourly_volume(currency_pair, data, 'rsi', current_time, timeframe, 5.0)
+            self.assertAlmostEqual(mean_volume, reference_mean_volume(data, 5.0))
+
+            # Valeurs recalculées en place sur la même fenêtre
+            data.loc[data.index[:50], 'rsi'] += 3.0
+            _, mean_volume = calculate_hourly_volume(currency_pair, data, 'rsi', current_time, timeframe, 5.0)
+            self.assertAlmostEqual(mean_volume, reference_mean_volume(data, 5.0))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from framework.caching.cache_expire import CacheExpire
+from framework.caching.cache_expire_manager import CacheExpireManager
+
+
+class TestCacheExpireManager(unittest.TestCase):
+
+    def setUp(self):
+        """Crée un cache vide et un gestionnaire associé à une clé de test."""
+        self.cache_expire = CacheExpire()
+        self.manager = CacheExpireManager(self.cache_expire, 'key', timeout_in_seconds=60)
+        self.producer_calls = 0
+
+    def produce(self, value):
+        self.producer_calls += 1
+        return value
+
+    def test_get_or_compute_caches_value(self):
+        """Test de get_or_compute : la valeur calculée est mise en cache et le producteur n'est appelé qu'une fois."""
+        self.assertEqual(self.manager.get_or_compute(lambda: self.produce(42)), 42)
+        self.assertEqual(self.manager.get_or_compute(lambda: self.produce(43)), 42)
+        self.assertEqual(self.producer_calls, 1)
+        self.assertEqual(self.cache_expire.get_value_if_not_expired('key'), 42)
+
+    def test_get_or_compute_does_not_cache_none(self):
+        """Test de get_or_compute : une valeur None n'est pas écrite dans le cache, comme avec la forme `with`."""
+        self.assertIsNone(self.manager.get_or_compute(lambda: self.produce(None)))
+        self.assertNotIn('key', self.cache_expire.cache_entries)
+        self.assertEqual(self.manager.get_or_compute(lambda: self.produce(7)), 7)
+        self.assertEqual(self.producer_calls, 2)
+
+    def test_context_manager_does_not_cache_none(self):
+        """Test de la forme `with` : une valeur laissée à None n'est pas écrite dans le cache."""
+        with self.manager as manager:
+            self.assertIsNone(manager.cached_value)
+        self.assertNotIn('key', self.cache_expire.cache_entries)
+
+
+if __name__ == '__main__':
+    unittest.main()
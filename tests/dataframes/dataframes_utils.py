@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from pandas import DataFrame
+
+from framework.dataframes.dataframes_utils import adjust_column_values_within_limits, flag_rows_with_consecutive_true_values
+from framework.dataframes.temporary_columns_manager import TemporaryColumnsManager
+
+
+class TestDataframesUtils(unittest.TestCase):
+
+    @staticmethod
+    def flag_rows_with_loop(df: DataFrame, columns: list, consecutive_window: int):
+        """Référence : parcours ligne à ligne de toutes les fenêtres, comme l'implémentation d'origine."""
+        flags = [False] * len(df)
+        for i in range(len(df) - consecutive_window + 1):
+            if all(df.iloc[i + j][columns].all() for j in range(consecutive_window)):
+                flags[i:i + consecutive_window] = [True] * consecutive_window
+        return flags
+
+    def test_flag_rows_with_consecutive_true_values_matches_loop(self):
+        """Test de flag_rows_with_consecutive_true_values contre le parcours ligne à ligne, sur des DataFrames aléatoires."""
+        random_generator = np.random.default_rng(0)
+        for _ in range(50):
+            length = int(random_generator.integers(0, 30))
+            df = DataFrame({
+                'a': random_generator.random(length) < 0.8,
+                'b': random_generator.random(length) < 0.8,
+            })
+            for consecutive_window in (0, 1, 2, 3, 5, length, length + 1):
+                expected = self.flag_rows_with_loop(df, ['a', 'b'], consecutive_window)
+                # La colonne 'consecutive' est temporaire : elle est conservée le temps de la comparaison
+                with patch.object(TemporaryColumnsManager, '__exit__', lambda manager, *exception_info: None):
+                    result = flag_rows_with_consecutive_true_values(df.copy(), ['a', 'b'], consecutive_window)
+                self.assertEqual(result['consecutive'].tolist(), expected, f'length={length}, window={consecutive_window}')
+
+    def assert_balanced(self, column, lower_limit, upper_limit):
+        """Vérifie qu'autant de valeurs se situent au-dessus de la limite haute qu'en dessous de la limite basse."""
+        self.assertEqual(int((column > upper_limit).sum()), int((column < lower_limit).sum()))
+
+    def test_adjust_column_values_within_limits_balanced(self):
+        """Test d'une colonne déjà équilibrée : les valeurs ne sont pas décalées."""
+        df = DataFrame({'value': [10.0, 50.0, 60.0, 90.0]})
+        result = adjust_column_values_within_limits(df, 'value', 30.0, 70.0)
+        self.assertEqual(result.tolist(), [10.0, 50.0, 60.0, 90.0])
+
+    def test_adjust_column_values_within_limits_all_above(self):
+        """Test d'une colonne entièrement au-dessus de la limite haute : les valeurs sont décalées vers le bas."""
+        df = DataFrame({'value': [80.0, 82.0, 85.0, 91.0, 95.0]})
+        result = adjust_column_values_within_limits(df, 'value', 30.0, 70.0)
+        self.assert_balanced(result, 30.0, 70.0)
+        self.assertLess(result.iloc[0], 80.0)
+        np.testing.assert_allclose(np.diff(result.to_numpy()), [2.0, 3.0, 6.0, 4.0])  # Décalage uniforme
+
+    def test_adjust_column_values_within_limits_all_below(self):
+        """Test d'une colonne entièrement sous la limite basse : les valeurs sont décalées vers le haut."""
+        df = DataFrame({'value': [1.0, 5.0, 12.0, 20.0, 25.0, 28.0]})
+        result = adjust_column_values_within_limits(df, 'value', 30.0, 70.0)
+        self.assert_balanced(result, 30.0, 70.0)
+        self.assertGreater(result.iloc[0], 1.0)
+        np.testing.assert_allclose(np.diff(result.to_numpy()), [4.0, 7.0, 8.0, 5.0, 3.0])
+
+    def test_adjust_column_values_within_limits_with_nan(self):
+        """Test d'une colonne contenant des NaN : ils sont ignorés par l'équilibrage et conservés."""
+        df = DataFrame({'value': [np.nan, 75.0, 80.0, np.nan, 85.0, 10.0]})
+        result = adjust_column_values_within_limits(df, 'value', 30.0, 70.0)
+        self.assertEqual(result.isna().tolist(), [True, False, False, True, False, False])
+        self.assert_balanced(result, 30.0, 70.0)
+
+        all_nan = DataFrame({'value': [np.nan, np.nan]})
+        self.assertTrue(adjust_column_values_within_limits(all_nan, 'value', 30.0, 70.0).isna().all())
+
+
+if __name__ == '__main__':
+    unittest.main()
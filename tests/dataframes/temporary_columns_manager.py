@@ -1,4 +1,6 @@
 import unittest
+import warnings
+from unittest.mock import patch
 
 from pandas import DataFrame
 
@@ -84,6 +86,39 @@ class TestTemporaryColumnsManager(unittest.TestCase):
         # La colonne temporaire doit avoir été supprimée
         self.assertNotIn('temp_col', self.dataframe.columns)
 
+    def test_no_warnings_on_dataframe_copy(self):
+        """
+        Teste qu'aucun avertissement pandas ne remonte lors de l'ajout et de la suppression sur une copie filtrée.
+        """
+        # Une sélection filtrée déclenche SettingWithCopyWarning lors des modifications en place
+        filtered_dataframe = self.dataframe[self.dataframe['col1'] > 1]
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            with TemporaryColumnsManager(filtered_dataframe, keep=['col1'], drop=['temp_col', 'temp_col_2']):
+                self.assertIn('temp_col', filtered_dataframe.columns)
+            with TemporaryColumnsManager(filtered_dataframe, keep=['col1']):
+                pass
+
+        # Aucun avertissement ne doit avoir été émis par le gestionnaire
+        self.assertEqual([], [str(caught_warning.message) for caught_warning in caught_warnings])
+        self.assertNotIn('temp_col', filtered_dataframe.columns)
+
+    def test_other_warnings_not_silenced(self):
+        """
+        Teste que les avertissements autres que SettingWithCopyWarning émis par la suppression ne sont pas masqués.
+        """
+        original_drop = DataFrame.drop
+
+        def drop_with_future_warning(dataframe, *args, **kwargs):
+            warnings.warn('drop', FutureWarning)
+            return original_drop(dataframe, *args, **kwargs)
+
+        with patch.object(DataFrame, 'drop', drop_with_future_warning):
+            with self.assertWarns(FutureWarning):
+                with TemporaryColumnsManager(self.dataframe, drop=['temp_col']):
+                    pass
+        self.assertNotIn('temp_col', self.dataframe.columns)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,57 @@
+import logging
+import time
+import unittest
+
+from framework.logs.buffered_log_handler import BufferedLogHandler
+
+
+class RecordingHandler(logging.Handler):
+    """Gestionnaire cible conservant les enregistrements reçus."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestBufferedLogHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Crée un gestionnaire tamponné vers une cible d'enregistrement."""
+        self.target = RecordingHandler()
+        self.handler = BufferedLogHandler(capacity=100, flush_level=logging.WARNING, target=self.target, flush_interval=0.05)
+
+    def tearDown(self):
+        self.handler.close()
+
+    @staticmethod
+    def make_record(level):
+        return logging.LogRecord('test', level, __file__, 0, 'message', None, None)
+
+    def test_flush_on_warning(self):
+        """Test du vidage immédiat à partir du niveau WARNING, avec les enregistrements déjà en tampon."""
+        self.handler.handle(self.make_record(logging.INFO))
+        self.handler.handle(self.make_record(logging.WARNING))
+        self.assertEqual([record.levelno for record in self.target.records], [logging.INFO, logging.WARNING])
+
+    def test_periodic_flush_without_new_records(self):
+        """Test du vidage périodique : un enregistrement isolé est transmis sans nouvelle activité."""
+        self.handler.handle(self.make_record(logging.INFO))
+        deadline = time.monotonic() + 2.0
+        while not self.target.records and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.target.records), 1)
+
+    def test_close_stops_flush_thread(self):
+        """Test de close : le thread de vidage s'arrête et le tampon est vidé."""
+        self.handler.handle(self.make_record(logging.INFO))
+        self.handler.close()
+        self.handler.flush_thread.join(timeout=1.0)
+        self.assertFalse(self.handler.flush_thread.is_alive())
+        self.assertEqual(len(self.target.records), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from framework.parameters.parameters import Parameters
+
+
+class TestParametersConfigurationCache(unittest.TestCase):
+
+    def setUp(self):
+        """Crée un répertoire temporaire contenant les fichiers sources et le chemin du cache."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.source_file = os.path.join(self.directory.name, 'bot.yaml')
+        self.tokens_file = os.path.join(self.directory.name, 'pairs.yaml')
+        for file_name in (self.source_file, self.tokens_file):
+            with open(file_name, 'w') as f:
+                f.write('bot: {}\n')
+        self.cache_path = os.path.join(self.directory.name, 'bot.cache.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def store(self, configuration, tokens):
+        Parameters.store_configuration_cache(self.cache_path, self.source_file, self.tokens_file, [], configuration, tokens)
+
+    def write_cache(self, content):
+        with open(self.cache_path, 'w') as f:
+            f.write(content)
+
+    def test_cache_round_trip(self):
+        """Test du cache : les configurations enregistrées sont relues tant que les sources ne changent pas."""
+        configuration = {'bot': {'pairs': {'file': 'pairs.yaml'}, 'values': [1, 2.5, None, True]}}
+        tokens = {'forbidden': ['BTC']}
+        self.store(configuration, tokens)
+        self.assertEqual(Parameters.load_configuration_cache(self.cache_path, self.source_file), (configuration, tokens, self.tokens_file))
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['bot.cache.json', 'bot.yaml', 'pairs.yaml'])
+
+    def test_cache_stale_after_modification(self):
+        """Test du cache : une modification d'un fichier source invalide le cache."""
+        self.store({'bot': {}}, {'forbidden': []})
+        stat = os.stat(self.source_file)
+        os.utime(self.source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(Parameters.load_configuration_cache(self.cache_path, self.source_file))
+
+    def test_cache_rejected_for_another_configuration(self):
+        """Test du cache : un cache écrit pour un autre fichier de configuration de même nom n'est pas relu."""
+        self.store({'bot': {}}, {'forbidden': []})
+        other_directory = os.path.join(self.directory.name, 'other')
+        os.makedirs(other_directory)
+        other_source_file = os.path.join(other_directory, 'bot.yaml')
+        with open(other_source_file, 'w') as f:
+            f.write('bot: {}\n')
+        self.assertIsNone(Parameters.load_configuration_cache(self.cache_path, other_source_file))
+        self.assertIsNotNone(Parameters.load_configuration_cache(self.cache_path, self.source_file))
+
+    def test_cache_invalid_content_is_ignored(self):
+        """Test du cache : un contenu illisible ou de forme inattendue est ignoré sans lever d'exception."""
+        for content in ['', 'not json', '[]', '{}', '{"modification_times": [], "configuration": {}, "tokens": {}}',
+                        '{"modification_times": {"a": "1"}, "configuration": {}, "tokens": {}}',
+                        '{"modification_times": {}, "configuration": null, "tokens": {}}']:
+            self.write_cache(content)
+            self.assertIsNone(Parameters.load_configuration_cache(self.cache_path, self.source_file), content)
+
+    def test_cache_not_written_for_unserializable_configuration(self):
+        """Test du cache : une configuration non restituable en JSON n'est pas écrite et ne laisse aucun fichier temporaire."""
+        for configuration in [{'bot': {'start': datetime.date(2024, 1, 1)}}, {'bot': {1: 'integer key'}}]:
+            self.store(configuration, {'forbidden': []})
+            self.assertEqual(sorted(os.listdir(self.directory.name)), ['bot.yaml', 'pairs.yaml'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import decimal
+import math
+import random
+import unittest
+
+from framework.quotes.dollar import USDT
+from framework.quotes.quote import truncate_amount
+
+
+class TestQuote(unittest.TestCase):
+
+    def test_truncate_amount(self):
+        """Test de truncate_amount : troncature vers zéro à la précision demandée."""
+        self.assertEqual(truncate_amount(1.23456, 2), 1.23)
+        self.assertEqual(truncate_amount(1.239, 2), 1.23)
+        self.assertEqual(truncate_amount(5, 3), 5.0)
+        self.assertEqual(truncate_amount(0.999999, 0), 0.0)
+
+    def test_truncate_amount_negative(self):
+        """Test de truncate_amount sur des montants négatifs : la troncature se fait vers zéro, comme ROUND_DOWN."""
+        self.assertEqual(truncate_amount(-1.239, 2), -1.23)
+        self.assertEqual(truncate_amount(-0.5, 0), 0.0)
+
+    def test_truncate_amount_never_rounds_up(self):
+        """Test de truncate_amount : le résultat ne dépasse jamais le montant initial en valeur absolue."""
+        # 0.049999999999999996 * 100 est arrondi à 5.0 en flottant : un calcul par produit flottant donnerait 0.05
+        self.assertEqual(truncate_amount(0.049999999999999996, 2), 0.04)
+        self.assertEqual(truncate_amount(-0.049999999999999996, 2), -0.04)
+        for amount, pair_precision in [(0.29, 2), (826.0803999695916, 17), (0.059574195466850194, 16), (2.675, 2)]:
+            rounded_amount = truncate_amount(amount, pair_precision)
+            self.assertLessEqual(abs(rounded_amount), abs(amount), (amount, pair_precision))
+
+    def test_truncate_amount_binary_value(self):
+        """Test de truncate_amount : la troncature porte sur la valeur binaire exacte du montant."""
+        # 0.29, 1.15 et 847.4 sont légèrement inférieurs à leur écriture décimale une fois convertis en flottant
+        self.assertEqual(truncate_amount(0.29, 2), 0.28)
+        self.assertEqual(truncate_amount(1.15, 2), 1.14)
+        self.assertEqual(truncate_amount(847.4, 1), 847.3)
+        self.assertEqual(truncate_amount(847.4, 2), 847.39)
+        # 0.1 et 1.1 sont légèrement supérieurs : leur écriture décimale est conservée
+        self.assertEqual(truncate_amount(0.1, 1), 0.1)
+        self.assertEqual(truncate_amount(1.1, 1), 1.1)
+
+    def test_truncate_amount_matches_decimal(self):
+        """Test de truncate_amount contre Decimal(amount).quantize(..., ROUND_DOWN), sur des montants aléatoires."""
+        random_generator = random.Random(0)
+        for _ in range(20000):
+            pair_precision = random_generator.randint(0, 10)
+            amount = round(random_generator.uniform(-1, 1) * 10 ** random_generator.randint(-3, 5), random_generator.randint(0, 8))
+            expected_amount = float(decimal.Decimal(amount).quantize(decimal.Decimal('1.' + '0' * pair_precision),
+                                                                     rounding=decimal.ROUND_DOWN))
+            self.assertEqual(repr(truncate_amount(amount, pair_precision)), repr(expected_amount), (amount, pair_precision))
+
+    def test_truncate_amount_non_finite(self):
+        """Test de truncate_amount : NaN et l'infini sont retournés inchangés."""
+        self.assertTrue(math.isnan(truncate_amount(math.nan, 2)))
+        self.assertEqual(truncate_amount(math.inf, 2), math.inf)
+        self.assertEqual(truncate_amount(-math.inf, 2), -math.inf)
+
+    def test_manage_amount_precision(self):
+        """Test de manage_amount_precision : la quote retournée porte le montant tronqué."""
+        self.assertEqual(USDT(847.4).manage_amount_precision(1).amount, 847.3)
+        self.assertEqual(USDT(-12.3456).manage_amount_precision(2).amount, -12.34)
+        self.assertTrue(math.isnan(USDT(math.nan).manage_amount_precision(2).amount))
+
+
+if __name__ == '__main__':
+    unittest.main()
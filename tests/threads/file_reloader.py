@@ -0,0 +1,85 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from framework.threads.file_reloader import FileReloader
+
+
+class TestFileReloader(unittest.TestCase):
+
+    def setUp(self):
+        """Crée deux fichiers surveillables dans des répertoires distincts."""
+        self.temporary_directories = [tempfile.TemporaryDirectory() for _ in range(2)]
+        self.first_file, self.second_file = (os.path.join(directory.name, 'pairs.json') for directory in self.temporary_directories)
+        for file_path in (self.first_file, self.second_file):
+            with open(file_path, 'w') as f:
+                f.write('[]')
+        self.watched_files = [self.first_file]
+        self.reload_count = 0
+        self.reloaded = threading.Event()
+
+    def tearDown(self):
+        for directory in self.temporary_directories:
+            directory.cleanup()
+
+    def reload(self):
+        self.reload_count += 1
+        self.watched_files = [self.first_file, self.second_file]  # La configuration rechargée active un nouveau fichier
+        self.reloaded.set()
+
+    def touch(self, file_path, offset_ns):
+        """Avance l'horodatage de modification d'un fichier, sans dépendre de la résolution de l'horloge."""
+        modification_time = os.stat(file_path).st_mtime_ns + offset_ns
+        os.utime(file_path, ns=(modification_time, modification_time))
+
+    def wait_for_reload(self, timeout=2.0):
+        reloaded = self.reloaded.wait(timeout)
+        self.reloaded.clear()
+        return reloaded
+
+    def test_polling_reloads_on_change_and_watches_new_files(self):
+        """Test de la scrutation : un rechargement par modification, sans rechargement dû à l'ajout d'un fichier."""
+        file_reloader = FileReloader(lambda: self.watched_files, self.reload, poll_interval=0.05).start()
+        try:
+            # Aucune modification : aucun rechargement
+            self.assertFalse(self.wait_for_reload(0.3))
+
+            # Modification du fichier surveillé : un rechargement, qui ajoute le second fichier à la surveillance
+            self.touch(self.first_file, 10 ** 9)
+            self.assertTrue(self.wait_for_reload())
+            self.assertIn(os.path.abspath(self.second_file), file_reloader.watched_paths)
+
+            # L'ajout du second fichier ne doit pas, à lui seul, provoquer de rechargement
+            self.assertFalse(self.wait_for_reload(0.3))
+            self.assertEqual(self.reload_count, 1)
+
+            # Le fichier ajouté est bien surveillé
+            self.touch(self.second_file, 10 ** 9)
+            self.assertTrue(self.wait_for_reload())
+            self.assertEqual(self.reload_count, 2)
+        finally:
+            file_reloader.stop()
+        self.assertFalse(file_reloader.worker_thread.is_alive())
+
+    def test_change_during_reload_is_detected(self):
+        """Test de la scrutation : une modification survenue pendant un rechargement qui ajoute un fichier en provoque un nouveau."""
+        def reload_and_modify():
+            self.reload_count += 1
+            if self.reload_count == 1:
+                self.touch(self.first_file, 10 ** 9)  # Fichier modifié pendant le rechargement
+                self.watched_files = [self.first_file, self.second_file]  # Qui active aussi un nouveau fichier
+            self.reloaded.set()
+
+        file_reloader = FileReloader(lambda: self.watched_files, reload_and_modify, poll_interval=0.05).start()
+        try:
+            self.touch(self.first_file, 10 ** 9)
+            self.assertTrue(self.wait_for_reload())
+            self.assertTrue(self.wait_for_reload())
+            self.assertEqual(self.reload_count, 2)
+        finally:
+            file_reloader.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
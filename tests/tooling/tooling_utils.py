@@ -0,0 +1,22 @@
+import unittest
+
+from framework.tooling.tooling_utils import list_diff
+
+
+class TestToolingUtils(unittest.TestCase):
+
+    def test_list_diff(self):
+        """Test de list_diff : l'ordre et les doublons de list_a sont conservés."""
+        self.assertEqual(list_diff(['b', 'a', 'c', 'a'], ['c']), ['b', 'a', 'a'])
+        self.assertEqual(list_diff([1, 2, 3], []), [1, 2, 3])
+        self.assertEqual(list_diff([], [1]), [])
+
+    def test_list_diff_unhashable_items(self):
+        """Test de list_diff avec des éléments non hachables dans list_b ou dans list_a."""
+        self.assertEqual(list_diff([1, [2], 3], [[2], 3]), [1])
+        self.assertEqual(list_diff([[1], 2, {'a': 1}], [2]), [[1], {'a': 1}])
+        self.assertEqual(list_diff([{'a': 1}, {'b': 2}], [{'a': 1}]), [{'b': 2}])
+
+
+if __name__ == '__main__':
+    unittest.main()